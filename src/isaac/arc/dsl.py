@@ -17,16 +17,30 @@ Extended for ARC-AGI 2 with:
 - Boolean grid operations (AND, OR, XOR)
 - Colour-based operations
 - Size-based sorting and recolouring
+
+Primitives always return a freshly allocated array that never aliases the
+input.  ``.copy()`` is only applied where NumPy hands back a view (rotations,
+flips, transposes, slices); calls that already allocate (``np.pad``,
+``np.tile``, ``np.repeat``, fancy indexing, arithmetic) are returned as-is.
 """
 
 from __future__ import annotations
 
+import inspect
 import logging
+from collections import deque
+from functools import lru_cache
 from typing import Any, Callable
 
 import numpy as np
 
-from isaac.arc.grid_ops import Grid
+from isaac.arc.grid_ops import (
+    _LABEL_MIN_CELLS,
+    FOUR_CONNECTED,
+    Grid,
+    GridObject,
+    load_ndimage,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -79,36 +93,86 @@ def diagonal_flip(grid: Grid) -> Grid:
     return np.rot90(np.fliplr(grid)).copy()
 
 
+def _wrap_shift(grid: Grid, n: int, axis: int) -> Grid:
+    """Cyclically shift *grid* by *n* along *axis* with two slice copies.
+
+    Equivalent to ``np.roll`` for a single axis, without its index
+    arithmetic; the output is always a new C-contiguous array.
+    """
+    size = grid.shape[axis]
+    n = n % size if size else 0
+    if n == 0:
+        return grid.copy()
+    head = [slice(None)] * grid.ndim
+    tail = [slice(None)] * grid.ndim
+    out = np.empty_like(grid)
+    head[axis], tail[axis] = slice(None, n), slice(-n, None)
+    out[tuple(head)] = grid[tuple(tail)]
+    head[axis], tail[axis] = slice(n, None), slice(None, -n)
+    out[tuple(head)] = grid[tuple(tail)]
+    return out
+
+
 def shift_right(grid: Grid, n: int = 1) -> Grid:
     """Shift all cells right by *n* positions with wrapping."""
-    return np.roll(grid, n, axis=1).copy()
+    return _wrap_shift(grid, n, axis=-1)
 
 
 def shift_left(grid: Grid, n: int = 1) -> Grid:
     """Shift all cells left by *n* positions with wrapping."""
-    return np.roll(grid, -n, axis=1).copy()
+    return _wrap_shift(grid, -n, axis=-1)
 
 
 def shift_down(grid: Grid, n: int = 1) -> Grid:
     """Shift all cells down by *n* positions with wrapping."""
-    return np.roll(grid, n, axis=0).copy()
+    return _wrap_shift(grid, n, axis=-2)
 
 
 def shift_up(grid: Grid, n: int = 1) -> Grid:
     """Shift all cells up by *n* positions with wrapping."""
-    return np.roll(grid, -n, axis=0).copy()
+    return _wrap_shift(grid, -n, axis=-2)
+
+
+@lru_cache(maxsize=256)
+def _fill_lut(from_colour: int, to_colour: int) -> np.ndarray:
+    """256-entry uint8 table mapping *from_colour* to *to_colour*."""
+    lut = np.arange(256, dtype=np.uint8)
+    lut[from_colour] = to_colour
+    lut.setflags(write=False)
+    return lut
+
+
+@lru_cache(maxsize=32)
+def _invert_lut(max_colour: int) -> np.ndarray:
+    """256-entry int16 table of ``max_colour - value``."""
+    lut = max_colour - np.arange(256, dtype=np.int16)
+    lut.setflags(write=False)
+    return lut
 
 
 def fill_colour(grid: Grid, from_colour: int, to_colour: int) -> Grid:
-    """Replace all cells of *from_colour* with *to_colour*."""
+    """Replace all cells of *from_colour* with *to_colour*.
+
+    uint8 grids are remapped with a single lookup-table gather.
+    """
+    if grid.dtype == np.uint8 and 0 <= from_colour < 256 and 0 <= to_colour < 256:
+        return _fill_lut(from_colour, to_colour)[grid]
     result = grid.copy()
     result[result == from_colour] = to_colour
     return result
 
 
 def invert_colours(grid: Grid, max_colour: int = 9) -> Grid:
-    """Invert colours: cell = max_colour - cell."""
-    return (max_colour - grid).copy()
+    """Invert colours: cell = max_colour - cell.
+
+    Unsigned grids are widened so cells above *max_colour* become negative
+    instead of wrapping around; uint8 grids go through a lookup table.
+    """
+    if grid.dtype == np.uint8 and abs(max_colour) < 2 ** 14:
+        return _invert_lut(max_colour)[grid]
+    if grid.dtype.kind == "u":
+        grid = grid.astype(np.int16)
+    return max_colour - grid
 
 
 def crop_to_object(grid: Grid, background: int = 0) -> Grid:
@@ -118,98 +182,124 @@ def crop_to_object(grid: Grid, background: int = 0) -> Grid:
         return grid.copy()
     rows = np.any(mask, axis=1)
     cols = np.any(mask, axis=0)
-    return grid[np.ix_(rows, cols)].copy()
+    return grid[np.ix_(rows, cols)]
 
 
 def pad_grid(grid: Grid, pad: int = 1, value: int = 0) -> Grid:
     """Pad the grid with *value* on all sides."""
-    return np.pad(grid, pad, mode="constant", constant_values=value).copy()
+    return np.pad(grid, pad, mode="constant", constant_values=value)
 
 
 def tile_grid(grid: Grid, rows: int = 2, cols: int = 2) -> Grid:
     """Tile the grid into a larger grid of *rows* x *cols* copies."""
-    return np.tile(grid, (rows, cols)).copy()
+    return np.tile(grid, (rows, cols))
+
+
+def _block_scale(grid: Grid, row_factor: int, col_factor: int) -> Grid:
+    """Expand each cell to a *row_factor* x *col_factor* block.
+
+    Broadcasting a 4-D view and reshaping materialises the output exactly
+    once, instead of the intermediate array left by two ``np.repeat`` calls.
+    """
+    if row_factor == 1 and col_factor == 1:
+        return grid.copy()  # reshape would hand back a view of the input
+    h, w = grid.shape
+    blocks = np.broadcast_to(grid[:, None, :, None], (h, row_factor, w, col_factor))
+    return blocks.reshape(h * row_factor, w * col_factor)
 
 
 def scale_up(grid: Grid, factor: int = 2) -> Grid:
     """Scale up each cell to a *factor* x *factor* block."""
-    return np.repeat(np.repeat(grid, factor, axis=0), factor, axis=1).copy()
+    return _block_scale(grid, factor, factor)
+
+
+def _settle(grid: Grid, background: int, axis: int, towards_end: bool) -> Grid:
+    """Stable-sort each line so non-background cells pack to one side.
+
+    Sorting the background mask keeps the relative order of the non-background
+    cells, which is exactly the per-column/per-row gravity semantics.
+    """
+    key = grid != background if towards_end else grid == background
+    order = np.argsort(key, axis=axis, kind="stable")
+    return np.take_along_axis(grid, order, axis=axis)
 
 
 def gravity_down(grid: Grid, background: int = 0) -> Grid:
     """Apply gravity: non-background cells fall to the bottom."""
-    result = np.full_like(grid, background)
-    for c in range(grid.shape[1]):
-        col = grid[:, c]
-        non_bg = col[col != background]
-        if len(non_bg) > 0:
-            result[-len(non_bg):, c] = non_bg
-    return result
+    return _settle(grid, background, axis=0, towards_end=True)
 
 
 def gravity_up(grid: Grid, background: int = 0) -> Grid:
     """Apply gravity: non-background cells rise to the top."""
-    result = np.full_like(grid, background)
-    for c in range(grid.shape[1]):
-        col = grid[:, c]
-        non_bg = col[col != background]
-        if len(non_bg) > 0:
-            result[:len(non_bg), c] = non_bg
-    return result
+    return _settle(grid, background, axis=0, towards_end=False)
 
 
 def gravity_left(grid: Grid, background: int = 0) -> Grid:
     """Apply gravity: non-background cells move to the left."""
-    result = np.full_like(grid, background)
-    for r in range(grid.shape[0]):
-        row = grid[r, :]
-        non_bg = row[row != background]
-        if len(non_bg) > 0:
-            result[r, :len(non_bg)] = non_bg
-    return result
+    return _settle(grid, background, axis=1, towards_end=False)
 
 
 def gravity_right(grid: Grid, background: int = 0) -> Grid:
     """Apply gravity: non-background cells move to the right."""
-    result = np.full_like(grid, background)
-    for r in range(grid.shape[0]):
-        row = grid[r, :]
-        non_bg = row[row != background]
-        if len(non_bg) > 0:
-            result[r, -len(non_bg):] = non_bg
-    return result
+    return _settle(grid, background, axis=1, towards_end=True)
 
 
 def hollow_rectangle(grid: Grid, background: int = 0) -> Grid:
-    """For each object, keep only the border cells."""
+    """For each object, keep only the border cells.
+
+    Only the four edges of each bounding box are visited, so the cost is
+    proportional to the object perimeter rather than its area.
+    """
     from isaac.arc.grid_ops import extract_objects
     result = np.full_like(grid, background)
+    labels = np.full(grid.shape, -1, dtype=np.int32)
     objects = extract_objects(grid, background)
+    for obj in objects:
+        labels[obj.rows, obj.cols] = obj.id
     for obj in objects:
         r1, c1, r2, c2 = obj.bbox
-        for r, c in obj.cells:
-            if r == r1 or r == r2 or c == c1 or c == c2:
-                result[r, c] = obj.colour
+        for edge in (
+            (r1, slice(c1, c2 + 1)),
+            (r2, slice(c1, c2 + 1)),
+            (slice(r1, r2 + 1), c1),
+            (slice(r1, r2 + 1), c2),
+        ):
+            result[edge][labels[edge] == obj.id] = obj.colour
     return result
 
 
 def flood_fill_from(grid: Grid, row: int, col: int, colour: int) -> Grid:
-    """Flood fill from (row, col) with *colour*, 4-connected."""
-    result = grid.copy()
-    h, w = result.shape
-    target = int(result[row, col])
+    """Flood fill from (row, col) with *colour*, 4-connected.
+
+    On larger grids, when SciPy is installed, the region is found with one
+    ``ndimage.label`` call.  Otherwise the fill walks a flat ``bytearray``
+    mask padded with a one-cell border of zeros, so neighbours are plain
+    index offsets and the border stops the walk without bounds checks.
+    """
+    h, w = grid.shape
+    target = grid[row, col]
     if target == colour:
+        return grid.copy()
+    row, col = row % h, col % w
+    ndimage = load_ndimage() if grid.size >= _LABEL_MIN_CELLS else None
+    if ndimage is not None:
+        labels, _ = ndimage.label(grid == target, structure=FOUR_CONNECTED)
+        result = grid.copy()
+        result[labels == labels[row, col]] = colour
         return result
-    stack = [(row, col)]
-    while stack:
-        r, c = stack.pop()
-        if result[r, c] != target:
+    stride = w + 2
+    buf = bytearray((h + 2) * stride)
+    mask = np.frombuffer(buf, dtype=np.uint8).reshape(h + 2, stride)
+    mask[1:-1, 1:-1] = grid == target
+    queue = deque([(row + 1) * stride + col + 1])
+    while queue:
+        idx = queue.popleft()
+        if buf[idx] != 1:
             continue
-        result[r, c] = colour
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < h and 0 <= nc < w:
-                stack.append((nr, nc))
+        buf[idx] = 2
+        queue.extend((idx - 1, idx + 1, idx - stride, idx + stride))
+    result = grid.copy()
+    result[mask[1:-1, 1:-1] == 2] = colour
     return result
 
 
@@ -272,8 +362,7 @@ def select_largest_object(grid: Grid, background: int = 0) -> Grid:
         return np.full_like(grid, background)
     largest = max(objects, key=lambda o: o.size)
     result = np.full_like(grid, background)
-    for r, c in largest.cells:
-        result[r, c] = grid[r, c]
+    result[largest.rows, largest.cols] = grid[largest.rows, largest.cols]
     return result
 
 
@@ -285,8 +374,7 @@ def select_smallest_object(grid: Grid, background: int = 0) -> Grid:
         return np.full_like(grid, background)
     smallest = min(objects, key=lambda o: o.size)
     result = np.full_like(grid, background)
-    for r, c in smallest.cells:
-        result[r, c] = grid[r, c]
+    result[smallest.rows, smallest.cols] = grid[smallest.rows, smallest.cols]
     return result
 
 
@@ -299,8 +387,7 @@ def recolour_by_size(grid: Grid, background: int = 0) -> Grid:
     sorted_objs = sorted(objects, key=lambda o: o.size, reverse=True)
     result = np.full_like(grid, background)
     for rank, obj in enumerate(sorted_objs, start=1):
-        for r, c in obj.cells:
-            result[r, c] = rank % 10
+        result[obj.rows, obj.cols] = rank % 10
     return result
 
 
@@ -313,8 +400,7 @@ def recolour_by_position(grid: Grid, background: int = 0) -> Grid:
     sorted_objs = sorted(objects, key=lambda o: (o.bbox[0], o.bbox[1]))
     result = np.full_like(grid, background)
     for rank, obj in enumerate(sorted_objs, start=1):
-        for r, c in obj.cells:
-            result[r, c] = rank % 10
+        result[obj.rows, obj.cols] = rank % 10
     return result
 
 
@@ -366,12 +452,12 @@ def mirror_objects_to_fill_symmetry(grid: Grid, background: int = 0) -> Grid:
 
 def extend_pattern_right(grid: Grid, n_tiles: int = 1) -> Grid:
     """Extend by appending *n_tiles* copies to the right."""
-    return np.hstack([grid] + [grid] * n_tiles).copy()
+    return np.hstack([grid] + [grid] * n_tiles)
 
 
 def extend_pattern_down(grid: Grid, n_tiles: int = 1) -> Grid:
     """Extend by appending *n_tiles* copies downward."""
-    return np.vstack([grid] + [grid] * n_tiles).copy()
+    return np.vstack([grid] + [grid] * n_tiles)
 
 
 def remove_border(grid: Grid, n: int = 1) -> Grid:
@@ -396,7 +482,7 @@ def crop_to_colour(grid: Grid, colour: int) -> Grid:
         return grid.copy()
     rows = np.any(mask, axis=1)
     cols = np.any(mask, axis=0)
-    return grid[np.ix_(rows, cols)].copy()
+    return grid[np.ix_(rows, cols)]
 
 
 def normalise_to_square(grid: Grid, background: int = 0) -> Grid:
@@ -512,6 +598,14 @@ def connect_objects_vertical(grid: Grid, colour: int = -1, background: int = 0)
     return result
 
 
+def _paste_shifted(result: Grid, grid: Grid, obj: GridObject, dr: int, dc: int) -> None:
+    """Copy *obj*'s cells of *grid* into *result* moved by (dr, dc), clipped to the grid."""
+    h, w = grid.shape
+    rows, cols = obj.rows + dr, obj.cols + dc
+    keep = (rows >= 0) & (rows < h) & (cols >= 0) & (cols < w)
+    result[rows[keep], cols[keep]] = grid[obj.rows[keep], obj.cols[keep]]
+
+
 def object_to_border(grid: Grid, background: int = 0) -> Grid:
     """Move each object to the nearest border edge."""
     from isaac.arc.grid_ops import extract_objects
@@ -532,10 +626,7 @@ def object_to_border(grid: Grid, background: int = 0) -> Grid:
             dr, dc = 0, int(-c1)
         else:
             dr, dc = 0, int(w - 1 - c2)
-        for r, c in obj.cells:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < h and 0 <= nc < w:
-                result[nr, nc] = grid[r, c]
+        _paste_shifted(result, grid, obj, dr, dc)
     return result
 
 
@@ -584,10 +675,7 @@ def sort_objects_by_size(grid: Grid, ascending: bool = True, background: int = 0
     for obj, pos in zip(sorted_objs, positions):
         r_offset = pos[0] - obj.bbox[0]
         c_offset = pos[1] - obj.bbox[1]
-        for r, c in obj.cells:
-            nr, nc = r + r_offset, c + c_offset
-            if 0 <= nr < grid.shape[0] and 0 <= nc < grid.shape[1]:
-                result[nr, nc] = grid[r, c]
+        _paste_shifted(result, grid, obj, r_offset, c_offset)
     return result
 
 
@@ -621,8 +709,7 @@ def mask_objects(grid: Grid, mask_colour: int, fill_colour: int, background: int
     objects = extract_objects(grid, background)
     for obj in objects:
         if obj.colour == mask_colour:
-            for r, c in obj.cells:
-                result[r, c] = fill_colour
+            result[obj.rows, obj.cols] = fill_colour
     return result
 
 
@@ -646,7 +733,7 @@ def upscale_to_size(grid: Grid, target_h: int = 10, target_w: int = 10) -> Grid:
     h, w = grid.shape
     r_factor = max(1, target_h // h)
     c_factor = max(1, target_w // w)
-    return np.repeat(np.repeat(grid, r_factor, axis=0), c_factor, axis=1).copy()
+    return _block_scale(grid, r_factor, c_factor)
 
 
 def reflect_about_main_diagonal(grid: Grid) -> Grid:
@@ -782,6 +869,94 @@ PRIMITIVES: dict[str, Transform] = {
 }
 
 
+# Stack-wise versions of the pure axis/arithmetic primitives.  Each takes an
+# ``(N, H, W)`` array and returns the same result as applying the 2-D
+# primitive (with default arguments) to every grid, in one NumPy call.
+BATCH_PRIMITIVES: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "identity": lambda s: s.copy(),
+    "rotate_90": lambda s: np.rot90(s, k=-1, axes=(-2, -1)).copy(),
+    "rotate_180": lambda s: np.rot90(s, k=2, axes=(-2, -1)).copy(),
+    "rotate_270": lambda s: np.rot90(s, k=-3, axes=(-2, -1)).copy(),
+    "flip_horizontal": lambda s: np.flip(s, axis=-1).copy(),
+    "flip_vertical": lambda s: np.flip(s, axis=-2).copy(),
+    "transpose": lambda s: np.swapaxes(s, -2, -1).copy(),
+    "reflect_about_main_diagonal": lambda s: np.swapaxes(s, -2, -1).copy(),
+    "diagonal_flip": lambda s: np.rot90(np.flip(s, axis=-1), axes=(-2, -1)).copy(),
+    "shift_right": shift_right,
+    "shift_left": shift_left,
+    "shift_down": shift_down,
+    "shift_up": shift_up,
+    "invert_colours": invert_colours,
+}
+
+
+Shape = tuple[int, ...]
+
+
+def _same_shape(shape: Shape) -> Shape:
+    return shape
+
+
+def _swapped_shape(shape: Shape) -> Shape:
+    return (shape[1], shape[0])
+
+
+def _remove_border_shape(shape: Shape) -> Shape:
+    h, w = shape
+    return shape if h <= 2 or w <= 2 else (h - 2, w - 2)
+
+
+# Output shape of each primitive (called with default arguments) as a
+# function of its input shape.  Lets the search reject a candidate whose
+# result cannot match the target shape without running it.  Primitives
+# whose output shape depends on grid content (crops) are not listed.
+OUTPUT_SHAPES: dict[str, Callable[[Shape], Shape]] = {
+    **dict.fromkeys(
+        (
+            "identity", "rotate_180", "flip_horizontal", "flip_vertical",
+            "shift_right", "shift_left", "shift_down", "shift_up", "invert_colours",
+            "replace_background", "recolour_by_size", "recolour_by_position",
+            "center_object", "gravity_down", "gravity_up", "gravity_left", "gravity_right",
+            "select_largest_object", "select_smallest_object", "sort_objects_by_size",
+            "object_to_border", "hollow_rectangle", "fill_enclosed_regions",
+            "fill_enclosed_auto", "outline_objects", "expand_objects", "erode_objects",
+            "complete_symmetry_horizontal", "complete_symmetry_vertical",
+            "mirror_objects_to_fill_symmetry", "connect_objects_horizontal",
+            "connect_objects_vertical", "count_to_cells",
+        ),
+        _same_shape,
+    ),
+    **dict.fromkeys(
+        ("rotate_90", "rotate_270", "transpose", "reflect_about_main_diagonal", "diagonal_flip"),
+        _swapped_shape,
+    ),
+    "pad_grid": lambda s: (s[0] + 2, s[1] + 2),
+    "add_border": lambda s: (s[0] + 2, s[1] + 2),
+    "remove_border": _remove_border_shape,
+    "tile_grid": lambda s: (2 * s[0], 2 * s[1]),
+    "scale_up": lambda s: (2 * s[0], 2 * s[1]),
+    "extend_pattern_right": lambda s: (s[0], 2 * s[1]),
+    "extend_pattern_down": lambda s: (2 * s[0], s[1]),
+    "split_grid_horizontal": lambda s: (s[0] // 2, s[1]),
+    "split_grid_vertical": lambda s: (s[0], s[1] // 2),
+    "normalise_to_square": lambda s: (max(s), max(s)),
+    "upscale_to_size": lambda s: (s[0] * max(1, 10 // s[0]), s[1] * max(1, 10 // s[1])),
+}
+
+
+def _param_spec(fn: Transform) -> tuple[frozenset[str], frozenset[str]]:
+    """Return ``(accepted, required)`` keyword names after the grid argument."""
+    params = list(inspect.signature(fn).parameters.values())[1:]
+    accepted = frozenset(p.name for p in params)
+    required = frozenset(p.name for p in params if p.default is inspect.Parameter.empty)
+    return accepted, required
+
+
+_PRIM_PARAMS: dict[str, tuple[frozenset[str], frozenset[str]]] = {
+    name: _param_spec(fn) for name, fn in PRIMITIVES.items()
+}
+
+
 def compose(*transforms: Transform) -> Transform:
     """Compose multiple transforms: f, g, h → h(g(f(grid)))."""
     def composed(grid: Grid) -> Grid:
@@ -800,8 +975,12 @@ def apply_program(
 
     Each step: ``{"op": "rotate_90"}`` or
     ``{"op": "fill_colour", "args": {"from_colour": 1, "to_colour": 2}}``.
+    Arguments the primitive does not accept are dropped; steps missing a
+    required argument are skipped.
     """
-    result = grid.copy()
+    # Primitives own their output allocation, so the input is only copied
+    # when no step ran and it would otherwise be returned aliased.
+    result = grid
     for step in program:
         op_name = step.get("op", "identity")
         args = step.get("args", {})
@@ -809,11 +988,14 @@ def apply_program(
         if fn is None:
             logger.warning("Unknown DSL op: %s — skipping.", op_name)
             continue
-        try:
-            result = fn(result, **args)
-        except TypeError:
-            try:
-                result = fn(result)
-            except Exception as exc:
-                logger.debug("DSL op %s failed: %s", op_name, exc)
-    return result
+        spec = _PRIM_PARAMS.get(op_name)
+        if spec is None:
+            spec = _PRIM_PARAMS[op_name] = _param_spec(fn)
+        accepted, required = spec
+        kwargs = {k: v for k, v in args.items() if k in accepted}
+        missing = required - kwargs.keys()
+        if missing:
+            logger.debug("DSL op %s missing args %s — skipping.", op_name, sorted(missing))
+            continue
+        result = fn(result, **kwargs)
+    return grid.copy() if result is grid else result
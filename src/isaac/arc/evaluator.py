@@ -12,18 +12,42 @@ from __future__ import annotations
 
 import json
 import logging
+import marshal
+import multiprocessing
+import os
+import re
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from functools import lru_cache
+from multiprocessing.connection import Connection
 from pathlib import Path
-from typing import Any
+from types import CodeType
+from typing import Any, Callable
 
 import numpy as np
 
-from isaac.arc.dsl import PRIMITIVES, apply_program, compose
-from isaac.arc.grid_ops import Grid, analyse_grid, format_grid_for_prompt, grid_diff
+from isaac.arc.dsl import (
+    BATCH_PRIMITIVES,
+    OUTPUT_SHAPES,
+    PRIMITIVES,
+    apply_program,
+    compose,
+)
+from isaac.arc.grid_ops import (
+    GRID_DTYPE,
+    Grid,
+    analyse_grid,
+    format_grid_for_prompt,
+    grid_diff,
+    grid_hash,
+)
 
 logger = logging.getLogger(__name__)
 
+_CODE_FENCE_RE = re.compile(r"```(?:python)?\s*\n(.*?)```", re.DOTALL)
+
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -46,6 +70,35 @@ class ArcTask:
     train: list[ArcPair]
     test: list[ArcPair]
     description: str = ""
+    train_inputs: list[Grid] = field(init=False, repr=False, compare=False)
+    """Training inputs in pair order (structure-of-arrays view of ``train``)."""
+    train_outputs: list[Grid] = field(init=False, repr=False, compare=False)
+    """Training outputs in pair order."""
+    train_inputs_stacked: np.ndarray | None = field(init=False, repr=False, compare=False)
+    """``(N, H, W)`` stack of training inputs when they all share one shape."""
+    train_outputs_stacked: np.ndarray | None = field(init=False, repr=False, compare=False)
+    """``(N, H, W)`` stack of training outputs when they all share one shape."""
+    train_output_keys: list[tuple[Any, ...]] = field(init=False, repr=False, compare=False)
+    """Content key of each training output, for fast rejection in search."""
+    test_output_keys: list[tuple[Any, ...]] = field(init=False, repr=False, compare=False)
+    """Content key of each test output, for scoring predictions."""
+    _prompt: str | None = field(default=None, init=False, repr=False, compare=False)
+    """Memoised :func:`build_arc_prompt` output; tasks are immutable once built."""
+
+    def __post_init__(self) -> None:
+        self.train_inputs = [pair.input for pair in self.train]
+        self.train_outputs = [pair.output for pair in self.train]
+        self.train_inputs_stacked = _stack_if_uniform(self.train_inputs)
+        self.train_outputs_stacked = _stack_if_uniform(self.train_outputs)
+        self.train_output_keys = [_grid_key(g) for g in self.train_outputs]
+        self.test_output_keys = [_grid_key(pair.output) for pair in self.test]
+
+
+def _stack_if_uniform(grids: list[Grid]) -> np.ndarray | None:
+    """Stack *grids* into one 3-D array if they all share a shape, else ``None``."""
+    if not grids or any(g.shape != grids[0].shape for g in grids):
+        return None
+    return np.stack(grids)
 
 
 @dataclass
@@ -99,15 +152,15 @@ def load_tasks(path: Path) -> list[ArcTask]:
     for item in items:
         train_pairs = [
             ArcPair(
-                input=np.array(p["input"], dtype=int),
-                output=np.array(p["output"], dtype=int),
+                input=np.array(p["input"], dtype=GRID_DTYPE),
+                output=np.array(p["output"], dtype=GRID_DTYPE),
             )
             for p in item.get("train", [])
         ]
         test_pairs = [
             ArcPair(
-                input=np.array(p["input"], dtype=int),
-                output=np.array(p["output"], dtype=int),
+                input=np.array(p["input"], dtype=GRID_DTYPE),
+                output=np.array(p["output"], dtype=GRID_DTYPE),
             )
             for p in item.get("test", [])
         ]
@@ -134,66 +187,204 @@ def load_tasks_from_dir(directory: Path) -> list[ArcTask]:
 # ---------------------------------------------------------------------------
 
 
+_PRIM_ITEMS: list[tuple[str, Callable[..., Grid]]] = list(PRIMITIVES.items())
+"""``(name, fn)`` pairs bound once so the search loops skip dict lookups."""
+
+
+def _apply_primitives_to_train(task: ArcTask) -> dict[str, list[Grid]]:
+    """Apply every primitive once to every training input.
+
+    Primitives that raise on any input are left out of the mapping.  The
+    result is shared by both search levels so first-stage outputs are never
+    recomputed inside the composition loop.  When the inputs share a shape,
+    primitives with a stack-wise variant run once over the whole stack.
+    """
+    stacked = task.train_inputs_stacked
+    outputs: dict[str, list[Grid]] = {}
+    for name, fn in _PRIM_ITEMS:
+        try:
+            batch_fn = BATCH_PRIMITIVES.get(name) if stacked is not None else None
+            if batch_fn is not None:
+                outputs[name] = list(batch_fn(stacked))
+            else:
+                outputs[name] = [fn(grid) for grid in task.train_inputs]
+        except Exception:
+            continue
+    return outputs
+
+
+def _grid_key(grid: Grid) -> tuple[tuple[int, ...], str, str]:
+    """Hashable content key for a grid: shape, dtype and a digest of its bytes.
+
+    Keys are cached on :class:`ArcTask` and shipped to pool workers, so the
+    digest must be stable across processes; the builtin ``hash`` is salted
+    per interpreter.
+    """
+    return (grid.shape, grid.dtype.str, grid_hash(grid))
+
+
+def _grids_match(
+    predictions: list[Any],
+    targets: list[Grid],
+    target_keys: list[tuple[Any, ...]],
+) -> bool:
+    """Return ``True`` if every prediction equals its target grid.
+
+    Each prediction is rejected on shape, then on content key against the
+    precomputed target keys.  Only when every key matches (or the dtypes
+    differ, so raw bytes are not comparable) are the grids compared
+    element-wise, which also guards against hash collisions.
+    """
+    for pred, target, key in zip(predictions, targets, target_keys):
+        pred = np.asarray(pred)
+        if pred.shape != target.shape:
+            return False
+        if pred.dtype == target.dtype and _grid_key(pred) != key:
+            return False
+    return all(np.array_equal(pred, target) for pred, target in zip(predictions, targets))
+
+
+def _matches_all(predictions: list[Any], task: ArcTask) -> bool:
+    """Return ``True`` if every prediction equals its training output."""
+    return _grids_match(predictions, task.train_outputs, task.train_output_keys)
+
+
+def _test_correct(predictions: list[Any], task: ArcTask) -> bool:
+    """Return ``True`` if every prediction equals its test output."""
+    return _grids_match(
+        predictions, [pair.output for pair in task.test], task.test_output_keys,
+    )
+
+
 def _try_single_primitive(
     task: ArcTask,
+    candidate_outputs: dict[str, list[Grid]] | None = None,
 ) -> TaskResult | None:
     """Try each single DSL primitive and check if it solves all training pairs."""
-    for name, fn in PRIMITIVES.items():
+    if candidate_outputs is None:
+        candidate_outputs = _apply_primitives_to_train(task)
+    for name, outputs in candidate_outputs.items():
+        if not _matches_all(outputs, task):
+            continue
+        fn = PRIMITIVES[name]
         try:
-            if all(
-                np.array_equal(fn(pair.input), pair.output)
-                for pair in task.train
-            ):
-                # Verify on test pairs
-                predictions = [fn(pair.input) for pair in task.test]
-                correct = all(
-                    np.array_equal(pred, pair.output)
-                    for pred, pair in zip(predictions, task.test)
-                )
-                return TaskResult(
-                    task_id=task.id,
-                    correct=correct,
-                    predicted=predictions,
-                    program=[{"op": name}],
-                    method="dsl_single",
-                )
+            # Verify on test pairs
+            predictions = [fn(pair.input) for pair in task.test]
         except Exception:
             continue
+        correct = _test_correct(predictions, task)
+        return TaskResult(
+            task_id=task.id,
+            correct=correct,
+            predicted=predictions,
+            program=[{"op": name}],
+            method="dsl_single",
+        )
     return None
 
 
+_TILE_CACHE_BYTES = 1 << 20
+"""Working-set budget (roughly one L2) for a tile of first-stage outputs."""
+
+
+def _output_signature(outputs: list[Grid]) -> tuple[tuple[Any, ...], ...]:
+    """Content key for a list of grids: shape, dtype and raw bytes of each."""
+    return tuple((g.shape, g.dtype.str, g.tobytes()) for g in outputs)
+
+
+def _group_equivalent(
+    candidate_outputs: dict[str, list[Grid]],
+) -> list[tuple[list[str], list[Grid]]]:
+    """Group primitives whose training outputs are byte-identical.
+
+    Returns ``(names, outputs)`` groups in first-occurrence order, so the
+    first name in each group is the one the plain search would reach first.
+    """
+    groups: dict[tuple[tuple[Any, ...], ...], tuple[list[str], list[Grid]]] = {}
+    for name, outputs in candidate_outputs.items():
+        group = groups.setdefault(_output_signature(outputs), ([], outputs))
+        group[0].append(name)
+    return list(groups.values())
+
+
+def _shapes_reachable(
+    shape_rule: Callable[[tuple[int, ...]], tuple[int, ...]],
+    input_shapes: list[tuple[int, ...]],
+    target_shapes: list[tuple[int, ...]],
+) -> bool:
+    """Return ``False`` if *shape_rule* cannot map every input to its target shape."""
+    try:
+        return all(shape_rule(s) == t for s, t in zip(input_shapes, target_shapes))
+    except Exception:
+        return True  # let the primitive itself decide
+
+
 def _try_two_primitive_composition(
     task: ArcTask,
     max_combinations: int = 2000,
+    candidate_outputs: dict[str, list[Grid]] | None = None,
 ) -> TaskResult | None:
-    """Try all 2-primitive compositions."""
-    names = list(PRIMITIVES.keys())
-    tried = 0
-    for name_a in names:
-        for name_b in names:
-            if tried >= max_combinations:
-                return None
-            tried += 1
-            fn = compose(PRIMITIVES[name_a], PRIMITIVES[name_b])
-            try:
-                if all(
-                    np.array_equal(fn(pair.input), pair.output)
-                    for pair in task.train
+    """Try all 2-primitive compositions.
+
+    The second primitive is applied to the cached first-stage outputs, so
+    each candidate costs one primitive application per training pair.
+    First-stage primitives with identical outputs (e.g. ``rotate_180`` and
+    ``flip_horizontal`` on a symmetric grid) are only expanded once.
+
+    Second-stage primitives with a known output-shape rule are skipped
+    without running when the projected shapes cannot match the targets.
+
+    First-stage groups are processed in tiles sized to stay cache-resident;
+    every second-stage primitive runs over the whole tile before the next
+    tile is touched.  Matches inside a tile are ranked in the plain
+    first-then-second order, so the reported program and the
+    *max_combinations* cut-off are the same as an untiled search.
+    """
+    if candidate_outputs is None:
+        candidate_outputs = _apply_primitives_to_train(task)
+    n_names = len(_PRIM_ITEMS)
+    groups = _group_equivalent(candidate_outputs)
+    group_bytes = max((sum(g.nbytes for g in outs) for _, outs in groups), default=1)
+    tile_size = max(1, _TILE_CACHE_BYTES // max(group_bytes, 1))
+    group_shapes = [[g.shape for g in outs] for _, outs in groups]
+    target_shapes = [g.shape for g in task.train_outputs]
+
+    for tile_start in range(0, len(groups), tile_size):
+        if tile_start * n_names >= max_combinations:
+            return None
+        tile = groups[tile_start:tile_start + tile_size]
+        matches: list[tuple[int, int]] = []
+        for b_idx, (name_b, fn_b) in enumerate(_PRIM_ITEMS):
+            shape_rule = OUTPUT_SHAPES.get(name_b)
+            for a_rank, (_, first_stage) in enumerate(tile, start=tile_start):
+                if a_rank * n_names + b_idx >= max_combinations:
+                    break
+                if shape_rule is not None and not _shapes_reachable(
+                    shape_rule, group_shapes[a_rank], target_shapes,
                 ):
+                    continue
+                try:
+                    if _matches_all([fn_b(grid) for grid in first_stage], task):
+                        matches.append((a_rank, b_idx))
+                except Exception:
+                    continue
+
+        for a_rank, b_idx in sorted(matches):
+            name_b, fn_b = _PRIM_ITEMS[b_idx]
+            for name_a in groups[a_rank][0]:
+                fn = compose(PRIMITIVES[name_a], fn_b)
+                try:
                     predictions = [fn(pair.input) for pair in task.test]
-                    correct = all(
-                        np.array_equal(pred, pair.output)
-                        for pred, pair in zip(predictions, task.test)
-                    )
-                    return TaskResult(
-                        task_id=task.id,
-                        correct=correct,
-                        predicted=predictions,
-                        program=[{"op": name_a}, {"op": name_b}],
-                        method="dsl_compose_2",
-                    )
-            except Exception:
-                continue
+                except Exception:
+                    continue
+                correct = _test_correct(predictions, task)
+                return TaskResult(
+                    task_id=task.id,
+                    correct=correct,
+                    predicted=predictions,
+                    program=[{"op": name_a}, {"op": name_b}],
+                    method="dsl_compose_2",
+                )
     return None
 
 
@@ -203,15 +394,16 @@ def solve_with_dsl(task: ArcTask) -> TaskResult:
     Tries single primitives first, then 2-compositions.
     """
     t0 = time.perf_counter()
+    candidate_outputs = _apply_primitives_to_train(task)
 
     # Level 1: single primitive
-    result = _try_single_primitive(task)
+    result = _try_single_primitive(task, candidate_outputs)
     if result is not None:
         result.solve_time_ms = (time.perf_counter() - t0) * 1000
         return result
 
     # Level 2: two-primitive composition
-    result = _try_two_primitive_composition(task)
+    result = _try_two_primitive_composition(task, candidate_outputs=candidate_outputs)
     if result is not None:
         result.solve_time_ms = (time.perf_counter() - t0) * 1000
         return result
@@ -239,7 +431,12 @@ def build_arc_prompt(task: ArcTask) -> str:
     - Prior analysis (objects, topology, symmetry)
     - Analogy engine findings (cross-pair hypotheses)
     - Chain-of-thought instruction
+
+    The prompt is built once per task and reused on LLM retries.
     """
+    if task._prompt is not None:
+        return task._prompt
+
     lines: list[str] = []
     lines.append("## ARC Task")
     if task.description:
@@ -298,7 +495,81 @@ def build_arc_prompt(task: ArcTask) -> str:
         "Use only numpy and the Python standard library.\n"
         "Respond ONLY with a fenced ```python``` code block."
     )
-    return "\n".join(lines)
+    task._prompt = "\n".join(lines)
+    return task._prompt
+
+
+_LLM_CODE_TIMEOUT_S = 10.0
+"""Wall-clock cap for running generated ``solve()`` code over one task."""
+
+
+@lru_cache(maxsize=256)
+def _compile_llm_code(code: str) -> CodeType:
+    """Compile generated code once; retries of the same source reuse it."""
+    return compile(code, "<llm>", "exec")
+
+
+def _llm_solve_worker(code: bytes, grids: list[Grid], conn: Connection) -> None:
+    """Child-process entry point: exec the marshalled *code* and apply ``solve`` to *grids*."""
+    try:
+        namespace: dict[str, Any] = {"np": np, "numpy": np}
+        exec(marshal.loads(code), namespace)  # noqa: S102
+        solve_fn = namespace.get("solve")
+        if solve_fn is None:
+            raise ValueError("No 'solve' function found in generated code.")
+        conn.send((True, [np.asarray(solve_fn(grid)) for grid in grids]))
+    except Exception as exc:
+        conn.send((False, f"{type(exc).__name__}: {exc}"))
+    finally:
+        conn.close()
+
+
+def _no_fork_context() -> multiprocessing.context.BaseContext:
+    """``forkserver`` where available, else ``spawn``: never a plain ``fork``.
+
+    Callers may have live threads (background graph compile, HTTP client
+    pools) and a forked child can deadlock on a lock inherited mid-acquire.
+    ``forkserver`` forks from a clean single-threaded server instead.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _run_llm_solve(
+    code: str,
+    grids: list[Grid],
+    timeout_s: float = _LLM_CODE_TIMEOUT_S,
+) -> list[Grid]:
+    """Run generated ``solve()`` over *grids* in a child process.
+
+    The code is compiled in the parent (cached per source) and the child
+    receives the marshalled code object, so syntax errors surface without
+    starting a child and the child never recompiles.  A child that does not answer within
+    *timeout_s* is terminated and ``TimeoutError`` is raised; errors inside
+    the code are re-raised as ``RuntimeError``.
+
+    The child is never forked from this process; see :func:`_no_fork_context`.
+    """
+    compiled = marshal.dumps(_compile_llm_code(code))
+    ctx = _no_fork_context()
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_llm_solve_worker, args=(compiled, grids, send_conn), daemon=True)
+    proc.start()
+    send_conn.close()
+    try:
+        if not recv_conn.poll(timeout_s):
+            raise TimeoutError(f"Generated solve() exceeded {timeout_s:.1f}s.")
+        ok, payload = recv_conn.recv()
+    except EOFError:
+        raise RuntimeError("Generated solve() crashed the worker process.") from None
+    finally:
+        recv_conn.close()
+        if proc.is_alive():
+            proc.terminate()
+        proc.join()
+    if not ok:
+        raise RuntimeError(payload)
+    return payload
 
 
 def solve_with_llm(
@@ -339,23 +610,17 @@ def solve_with_llm(
         content = response.content if isinstance(response.content, str) else str(response.content)
 
         # Extract code
-        import re
-        match = re.search(r"```(?:python)?\s*\n(.*?)```", content, re.DOTALL)
+        match = _CODE_FENCE_RE.search(content)
         code = match.group(1).strip() if match else content.strip()
 
-        # Execute the code to get the solve function
-        namespace: dict[str, Any] = {"np": np, "numpy": np}
-        exec(code, namespace)  # noqa: S102
-        solve_fn = namespace.get("solve")
-
-        if solve_fn is None:
-            raise ValueError("No 'solve' function found in generated code.")
+        # Run solve() on train + test inputs in a time-capped child process
+        n_train = len(task.train)
+        outputs = _run_llm_solve(
+            code, task.train_inputs + [pair.input for pair in task.test],
+        )
 
         # Validate on training data
-        train_ok = all(
-            np.array_equal(solve_fn(pair.input), pair.output)
-            for pair in task.train
-        )
+        train_ok = _matches_all(outputs[:n_train], task)
 
         if not train_ok:
             logger.info("LLM solution failed training validation for %s.", task.id)
@@ -363,11 +628,8 @@ def solve_with_llm(
             return solve_with_dsl(task)
 
         # Run on test data
-        predictions = [solve_fn(pair.input) for pair in task.test]
-        correct = all(
-            np.array_equal(pred, pair.output)
-            for pred, pair in zip(predictions, task.test)
-        )
+        predictions = outputs[n_train:]
+        correct = _test_correct(predictions, task)
 
         elapsed = (time.perf_counter() - t0) * 1000
         return TaskResult(
@@ -389,6 +651,29 @@ def solve_with_llm(
 # ---------------------------------------------------------------------------
 
 
+def _solve_dsl_parallel(
+    tasks: list[ArcTask],
+    max_workers: int | None = None,
+) -> list[TaskResult]:
+    """Run :func:`solve_with_dsl` over *tasks*, in a process pool when useful.
+
+    The DSL search is CPU-bound and tasks are independent, so they are
+    spread across processes.  Results are returned in task order.  Falls
+    back to an in-process loop for a single worker or if the pool fails.
+    Workers are never forked from this process (see :func:`_no_fork_context`).
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=_no_fork_context(),
+            ) as pool:
+                return list(pool.map(solve_with_dsl, tasks))
+        except (OSError, BrokenProcessPool) as exc:
+            logger.warning("DSL process pool unavailable (%s) — solving in-process.", exc)
+    return [solve_with_dsl(task) for task in tasks]
+
+
 def evaluate(
     tasks: list[ArcTask],
     solver: str = "synthesis",
@@ -396,6 +681,7 @@ def evaluate(
     time_budget_per_task_s: float = 30.0,
     beam_width: int = 30,
     max_depth: int = 3,
+    max_workers: int | None = None,
 ) -> EvalReport:
     """Run evaluation across all tasks.
 
@@ -416,6 +702,9 @@ def evaluate(
         Beam width for DSL beam search.
     max_depth:
         Maximum program depth in beam search.
+    max_workers:
+        Process count for the DSL search in the ``"dsl"`` and ``"hybrid"``
+        modes.  ``None`` uses every CPU; ``1`` keeps it in-process.
 
     Returns
     -------
@@ -425,7 +714,11 @@ def evaluate(
     report = EvalReport(total_tasks=len(tasks))
     t_start = time.perf_counter()
 
-    for task in tasks:
+    dsl_results: list[TaskResult] = []
+    if solver not in ("synthesis", "llm"):
+        dsl_results = _solve_dsl_parallel(tasks, max_workers)
+
+    for i, task in enumerate(tasks):
         logger.info("Evaluating task %s (%d train, %d test)...",
                     task.id, len(task.train), len(task.test))
 
@@ -445,12 +738,12 @@ def evaluate(
                 if not result.correct:
                     result = solve_with_llm(task, llm)
         elif solver == "dsl":
-            result = solve_with_dsl(task)
+            result = dsl_results[i]
         elif solver == "llm":
             result = solve_with_llm(task, llm)
         else:
-            # Hybrid: DSL first, then LLM
-            result = solve_with_dsl(task)
+            # Hybrid: DSL first (already run in the pool), then LLM
+            result = dsl_results[i]
             if not result.correct:
                 result = solve_with_llm(task, llm)
 
@@ -8,8 +8,10 @@ LLM operates on structured observations rather than raw pixel grids.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -17,6 +19,33 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 Grid = np.ndarray  # 2D array of ints (0 = background by convention)
+GRID_DTYPE = np.uint8  # ARC colours are 0-9, so one byte per cell is enough
+
+
+FOUR_CONNECTED = np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]], dtype=bool)
+
+# Below this many cells the Python flood fill beats SciPy labelling.
+_LABEL_MIN_CELLS = 64
+
+
+@lru_cache(maxsize=1)
+def load_ndimage() -> Any | None:
+    """Return ``scipy.ndimage`` if installed (``isaac[arc]`` extra), else ``None``."""
+    try:
+        from scipy import ndimage  # type: ignore[import-untyped]
+    except ImportError:
+        return None
+    return ndimage
+
+
+@lru_cache(maxsize=1)
+def load_xxhash() -> Any | None:
+    """Return the ``xxhash`` module if installed (``isaac[arc]`` extra), else ``None``."""
+    try:
+        import xxhash  # type: ignore[import-untyped]
+    except ImportError:
+        return None
+    return xxhash
 
 
 # ---------------------------------------------------------------------------
@@ -24,20 +53,31 @@ Grid = np.ndarray  # 2D array of ints (0 = background by convention)
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(eq=False)
 class GridObject:
-    """A contiguous region of non-background cells."""
+    """A contiguous region of non-background cells.
+
+    Cells are stored as parallel ``int16`` row/column arrays, so
+    ``grid[obj.rows, obj.cols]`` reads or paints the whole object at once.
+    """
 
     id: int
     colour: int
-    cells: list[tuple[int, int]]
-    """(row, col) coordinates of each cell."""
+    rows: np.ndarray
+    """Row index of each cell."""
+    cols: np.ndarray
+    """Column index of each cell, parallel to ``rows``."""
     bbox: tuple[int, int, int, int] = (0, 0, 0, 0)
     """Bounding box (min_row, min_col, max_row, max_col)."""
 
+    @property
+    def cells(self) -> list[tuple[int, int]]:
+        """(row, col) coordinates of each cell, built on access."""
+        return list(zip(self.rows.tolist(), self.cols.tolist(), strict=True))
+
     @property
     def size(self) -> int:
-        return len(self.cells)
+        return len(self.rows)
 
     @property
     def shape(self) -> tuple[int, int]:
@@ -72,14 +112,36 @@ class GridAnalysis:
 # ---------------------------------------------------------------------------
 
 
+def _colour_bincount(grid: Grid) -> np.ndarray | None:
+    """Cell count per colour value via one ``np.bincount`` pass.
+
+    Returns ``None`` for grids that are not small non-negative integers
+    (e.g. sentinels or floats); callers then fall back to ``np.unique``.
+    """
+    if grid.size == 0 or grid.dtype.kind not in "ui":
+        return None
+    if grid.dtype.kind == "i" and grid.min() < 0:
+        return None
+    if grid.dtype.itemsize > 1 and grid.max() >= 256:
+        return None
+    return np.bincount(grid.ravel(), minlength=10)
+
+
 def extract_colours(grid: Grid) -> dict[int, int]:
     """Return a map of colour → count."""
-    unique, counts = np.unique(grid, return_counts=True)
-    return dict(zip(unique.tolist(), counts.tolist()))
+    counts = _colour_bincount(grid)
+    if counts is None:
+        unique, counts = np.unique(grid, return_counts=True)
+        return dict(zip(unique.tolist(), counts.tolist(), strict=True))
+    present = np.flatnonzero(counts)
+    return dict(zip(present.tolist(), counts[present].tolist(), strict=True))
 
 
 def detect_background(grid: Grid) -> int:
     """Detect the background colour (most frequent value)."""
+    counts = _colour_bincount(grid)
+    if counts is not None:
+        return int(counts.argmax())
     colours = extract_colours(grid)
     return max(colours, key=colours.get)  # type: ignore[arg-type]
 
@@ -87,83 +149,212 @@ def detect_background(grid: Grid) -> int:
 def extract_objects(grid: Grid, background: int = 0) -> list[GridObject]:
     """Flood-fill extraction of contiguous non-background objects.
 
-    Uses 4-connectivity (up/down/left/right). Each object gets a unique ID.
+    Uses 4-connectivity (up/down/left/right). Each object gets a unique ID,
+    assigned in row-major order of the object's first cell.  With SciPy
+    installed, components of larger grids are labelled per colour by
+    ``ndimage.label``; otherwise a Python flood fill is used.
     """
+    ndimage = load_ndimage() if grid.size >= _LABEL_MIN_CELLS else None
+    if ndimage is not None:
+        return _extract_objects_labelled(grid, background, ndimage)
+
+    # Flat list of Python ints padded with a one-cell border of ``None`` so
+    # neighbours are plain index offsets and no bounds checks are needed.
     h, w = grid.shape
-    visited = np.zeros_like(grid, dtype=bool)
+    stride = w + 2
+    flat: list[int | None] = [None] * ((h + 2) * stride)
+    for r, row in enumerate(grid.tolist(), start=1):
+        flat[r * stride + 1:r * stride + 1 + w] = row
+    visited = bytearray(len(flat))
+    # Padded flat index of every object cell, object after object.
+    order: list[int] = []
+    found: list[tuple[int, int, int, tuple[int, int, int, int]]] = []
+
+    for start in range(stride, (h + 1) * stride):
+        colour = flat[start]
+        if colour is None or visited[start] or colour == background:
+            continue
+        # DFS flood fill.  The bounding box is accumulated as cells are
+        # visited; the seed is the object's first cell in row-major order,
+        # so it already holds the minimum row.
+        first = len(order)
+        min_r = start // stride
+        min_c = w + 1
+        max_r = max_c = -1
+        stack = [start]
+        visited[start] = 1
+        while stack:
+            idx = stack.pop()
+            order.append(idx)
+            cr, cc = divmod(idx, stride)
+            if cr > max_r:
+                max_r = cr
+            if cc < min_c:
+                min_c = cc
+            if cc > max_c:
+                max_c = cc
+            for nidx in (idx - stride, idx + stride, idx - 1, idx + 1):
+                if not visited[nidx] and flat[nidx] == colour:
+                    visited[nidx] = 1
+                    stack.append(nidx)
+        found.append((colour, first, len(order), (min_r - 1, min_c - 1, max_r - 1, max_c - 1)))
+
+    rows, cols = np.divmod(np.array(order, dtype=np.int32), stride)
+    rows = (rows - 1).astype(np.int16)
+    cols = (cols - 1).astype(np.int16)
+    return [
+        GridObject(id=i, colour=colour, rows=rows[lo:hi], cols=cols[lo:hi], bbox=bbox)
+        for i, (colour, lo, hi, bbox) in enumerate(found)
+    ]
+
+
+def _extract_objects_labelled(grid: Grid, background: int, ndimage: Any) -> list[GridObject]:
+    """:func:`extract_objects` backed by ``scipy.ndimage`` component labelling.
+
+    Each colour is labelled in one C call; the per-colour labels are merged
+    into a single label image so cells, sizes and bounding boxes for every
+    component come out of a handful of vectorised passes.
+    """
+    w = grid.shape[1]
+    labels = np.zeros(grid.shape, dtype=np.int32)
+    colours: list[int] = []
+    for colour in np.unique(grid).tolist():
+        if colour == background:
+            continue
+        colour_labels, n = ndimage.label(grid == colour, structure=FOUR_CONNECTED)
+        mask = colour_labels > 0
+        labels[mask] = colour_labels[mask] + len(colours)
+        colours.extend([colour] * n)
+    if not colours:
+        return []
+
+    flat = labels.ravel()
+    cell_idx = np.flatnonzero(flat)  # row-major
+    order = np.argsort(flat[cell_idx], kind="stable")
+    cell_idx = cell_idx[order]  # grouped by label, row-major within each label
+    counts = np.bincount(flat[cell_idx], minlength=len(colours) + 1)[1:]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    rows, cols = np.divmod(cell_idx, w)
+    rows, cols = rows.astype(np.int16), cols.astype(np.int16)
+    ends = starts + counts
+    # Cells are row-major within each label, so the first and last cell
+    # give the row extent directly; only the columns need a reduction.
+    r1s, r2s = rows[starts].tolist(), rows[ends - 1].tolist()
+    c1s = np.minimum.reduceat(cols, starts).tolist()
+    c2s = np.maximum.reduceat(cols, starts).tolist()
+    starts_l, ends_l = starts.tolist(), ends.tolist()
     objects: list[GridObject] = []
-    obj_id = 0
-
-    for r in range(h):
-        for c in range(w):
-            if visited[r, c] or grid[r, c] == background:
-                continue
-            # BFS flood fill
-            colour = int(grid[r, c])
-            cells: list[tuple[int, int]] = []
-            stack = [(r, c)]
-            visited[r, c] = True
-            while stack:
-                cr, cc = stack.pop()
-                cells.append((cr, cc))
-                for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    nr, nc = cr + dr, cc + dc
-                    if 0 <= nr < h and 0 <= nc < w and not visited[nr, nc]:
-                        if grid[nr, nc] == colour:
-                            visited[nr, nc] = True
-                            stack.append((nr, nc))
-
-            rows = [cell[0] for cell in cells]
-            cols = [cell[1] for cell in cells]
-            bbox = (min(rows), min(cols), max(rows), max(cols))
-            objects.append(GridObject(
-                id=obj_id, colour=colour, cells=cells, bbox=bbox,
-            ))
-            obj_id += 1
-
+    for obj_id, k in enumerate(np.argsort(cell_idx[starts], kind="stable").tolist()):
+        lo, hi = starts_l[k], ends_l[k]
+        objects.append(GridObject(
+            id=obj_id,
+            colour=colours[k],
+            rows=rows[lo:hi],
+            cols=cols[lo:hi],
+            bbox=(r1s[k], c1s[k], r2s[k], c2s[k]),
+        ))
     return objects
 
 
+def _rows_mirror(grid: Grid) -> bool:
+    """True if *grid* reads the same top-to-bottom as bottom-to-top.
+
+    The outer row pair is checked first, then only the top half against the
+    reversed bottom half, all through views.
+    """
+    half = grid.shape[0] // 2
+    if half == 0:
+        return True
+    if not np.array_equal(grid[0], grid[-1]):
+        return False
+    return np.array_equal(grid[:half], grid[::-1][:half])
+
+
+def _cols_mirror(grid: Grid) -> bool:
+    """True if *grid* reads the same left-to-right as right-to-left.
+
+    Same as ``_rows_mirror(grid.T)`` but slices columns in place, so the
+    comparison walks each row in memory order.
+    """
+    half = grid.shape[1] // 2
+    if half == 0:
+        return True
+    if not np.array_equal(grid[:, 0], grid[:, -1]):
+        return False
+    return np.array_equal(grid[:, :half], grid[:, ::-1][:, :half])
+
+
 def detect_symmetry(grid: Grid) -> dict[str, bool]:
     """Check for horizontal, vertical, and diagonal symmetry."""
-    h_sym = np.array_equal(grid, grid[::-1, :])
-    v_sym = np.array_equal(grid, grid[:, ::-1])
+    h_sym = _rows_mirror(grid)
+    v_sym = _cols_mirror(grid)
     d_sym = False
     if grid.shape[0] == grid.shape[1]:
-        d_sym = np.array_equal(grid, grid.T)
+        d_sym = grid.size == 0 or (
+            np.array_equal(grid[0], grid[:, 0]) and np.array_equal(grid, grid.T)
+        )
     return {"horizontal": h_sym, "vertical": v_sym, "diagonal": d_sym}
 
 
+def _has_period(data: bytes, n: int, row_bytes: int) -> bool:
+    """True if the *n* rows packed in *data* repeat with some period dividing *n*.
+
+    Shifting by *p* rows is a byte offset, so each candidate is one
+    ``bytes`` comparison (``memcmp``) that stops at the first difference.
+    """
+    return any(
+        data[p * row_bytes:] == data[:-p * row_bytes]
+        for p in range(1, n // 2 + 1)
+        if n % p == 0
+    )
+
+
 def detect_repeating_pattern(grid: Grid) -> bool:
-    """Check if the grid is a tiled repetition of a smaller pattern."""
+    """Check if the grid is a tiled repetition of a smaller pattern.
+
+    A ``(ph, pw)`` tile repeats across the grid exactly when the rows have
+    period *ph* and the columns period *pw*, so each axis is tested on its
+    own against the raw bytes of a C-ordered copy (rows, then columns via
+    the transpose).
+    """
     h, w = grid.shape
-    for ph in range(1, h // 2 + 1):
-        if h % ph != 0:
-            continue
-        for pw in range(1, w // 2 + 1):
-            if w % pw != 0:
-                continue
-            tile = grid[:ph, :pw]
-            is_tiled = True
-            for r in range(0, h, ph):
-                for c in range(0, w, pw):
-                    if not np.array_equal(grid[r:r + ph, c:c + pw], tile):
-                        is_tiled = False
-                        break
-                if not is_tiled:
-                    break
-            if is_tiled and (ph < h or pw < w):
-                return True
-    return False
+    if h < 2 or w < 2:
+        return False
+    g = np.ascontiguousarray(grid)
+    if not _has_period(g.tobytes(), h, w * g.itemsize):
+        return False
+    return _has_period(g.T.tobytes(), w, h * g.itemsize)
 
 
 def grid_hash(grid: Grid) -> str:
-    """Stable hash of a grid for deduplication."""
-    return str(hash(grid.tobytes()))
+    """Stable hash of a grid for deduplication.
+
+    The digest is taken straight from the array buffer (no ``bytes`` copy)
+    and, unlike the builtin ``hash``, is identical across processes.  Uses
+    XXH3 when ``xxhash`` is installed, otherwise 64-bit BLAKE2b.
+    """
+    buf = memoryview(np.ascontiguousarray(grid))
+    xxhash = load_xxhash()
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(buf)
+    return hashlib.blake2b(buf, digest_size=8).hexdigest()
 
 
 def analyse_grid(grid: Grid) -> GridAnalysis:
-    """Full structural analysis of an ARC grid."""
+    """Full structural analysis of an ARC grid.
+
+    Results are memoised on the grid's bytes, shape and dtype, so the same
+    grid seen again (e.g. by both the prompt builder and ``grid_diff``)
+    costs one lookup.  The returned analysis is shared; treat it as
+    read-only.
+    """
+    g = np.ascontiguousarray(grid)
+    return _analyse_cached(g.tobytes(), g.shape, g.dtype.str)
+
+
+@lru_cache(maxsize=512)
+def _analyse_cached(data: bytes, shape: tuple[int, ...], dtype: str) -> GridAnalysis:
+    grid = np.frombuffer(data, dtype=dtype).reshape(shape)
     colours = extract_colours(grid)
     bg = detect_background(grid)
     objects = extract_objects(grid, background=bg)
@@ -196,16 +387,21 @@ def grid_diff(input_grid: Grid, output_grid: Grid) -> dict[str, Any]:
     input_analysis = analyse_grid(input_grid)
     output_analysis = analyse_grid(output_grid)
 
+    n_changed = 0
     changed_cells: list[dict[str, Any]] = []
-    if input_grid.shape == output_grid.shape:
-        diff_mask = input_grid != output_grid
-        for r, c in zip(*np.where(diff_mask)):
-            changed_cells.append({
-                "row": int(r),
-                "col": int(c),
-                "from": int(input_grid[r, c]),
-                "to": int(output_grid[r, c]),
-            })
+    if input_grid.shape == output_grid.shape and input_grid is not output_grid:
+        rows, cols = np.nonzero(input_grid != output_grid)
+        n_changed = len(rows)
+        # Only the first 50 changes are reported (cap for prompt injection).
+        rows, cols = rows[:50], cols[:50]
+        changed_cells = [
+            {"row": r, "col": c, "from": a, "to": b}
+            for r, c, a, b in zip(
+                rows.tolist(), cols.tolist(),
+                input_grid[rows, cols].tolist(), output_grid[rows, cols].tolist(),
+                strict=True,
+            )
+        ]
 
     return {
         "input": {
@@ -221,8 +417,8 @@ def grid_diff(input_grid: Grid, output_grid: Grid) -> dict[str, Any]:
             "symmetry": output_analysis.symmetry,
         },
         "shape_changed": list(input_grid.shape) != list(output_grid.shape),
-        "n_changed_cells": len(changed_cells),
-        "changed_cells": changed_cells[:50],  # cap for prompt injection
+        "n_changed_cells": n_changed,
+        "changed_cells": changed_cells,
         "colour_changes": {
             "added": sorted(set(output_analysis.colour_counts) - set(input_analysis.colour_counts)),
             "removed": sorted(set(input_analysis.colour_counts) - set(output_analysis.colour_counts)),
@@ -231,7 +427,20 @@ def grid_diff(input_grid: Grid, output_grid: Grid) -> dict[str, Any]:
 
 
 def format_grid_for_prompt(grid: Grid) -> str:
-    """Render a grid as a compact string for LLM prompt injection."""
-    return "\n".join(
-        " ".join(str(int(cell)) for cell in row) for row in grid
-    )
+    """Render a grid as a compact string for LLM prompt injection.
+
+    Single-digit grids (every ARC grid) are written straight into a byte
+    buffer: digit characters in the even columns, separators in the odd
+    ones, decoded once.
+    """
+    h, w = grid.shape
+    counts = _colour_bincount(grid)
+    if counts is None or len(counts) > 10:
+        return "\n".join(
+            " ".join(str(int(cell)) for cell in row) for row in grid
+        )
+    buf = np.full((h, 2 * w), ord(" "), dtype=np.uint8)
+    buf[:, 0::2] = grid
+    buf[:, 0::2] += ord("0")
+    buf[:, -1] = ord("\n")
+    return buf.tobytes()[:-1].decode("ascii")
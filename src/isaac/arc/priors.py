@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -54,17 +55,29 @@ class ObjectSignature:
     centroid: tuple[float, float]
 
 
+@lru_cache(maxsize=4096)
+def _interned_shape(
+    shape: tuple[int, int], mask_bytes: bytes,
+) -> tuple[tuple[int, ...], ...]:
+    """Canonical ``normalized_shape`` tuple for a ``uint8`` object mask.
+
+    ARC grids repeat a handful of object shapes (single cells, 2x2 blocks,
+    bars), so each distinct mask is built once and shared by every object
+    with that shape; equal shapes are then usually the same tuple object.
+    """
+    mask = np.frombuffer(mask_bytes, dtype=np.uint8).reshape(shape)
+    return tuple(map(tuple, mask.tolist()))
+
+
 def compute_object_signature(obj: GridObject) -> ObjectSignature:
     """Compute a compact, comparable signature for *obj*."""
     r1, c1, r2, c2 = obj.bbox
     h, w = r2 - r1 + 1, c2 - c1 + 1
 
     # Normalised binary mask
-    cells_set = set(obj.cells)
-    mask = tuple(
-        tuple(1 if (r1 + dr, c1 + dc) in cells_set else 0 for dc in range(w))
-        for dr in range(h)
-    )
+    local = np.zeros((h, w), dtype=np.uint8)
+    local[obj.rows - r1, obj.cols - c1] = 1
+    mask = _interned_shape((h, w), local.tobytes())
 
     # Rectangle test: all cells in bbox present
     is_rect = obj.size == h * w
@@ -75,17 +88,14 @@ def compute_object_signature(obj: GridObject) -> ObjectSignature:
     is_diag = False
     if not is_hline and not is_vline and h == w:
         # Check main or anti diagonal
-        is_diag = all((r1 + i, c1 + i) in cells_set for i in range(h)) or \
-                  all((r1 + i, c2 - i) in cells_set for i in range(h))
+        is_diag = bool(local.diagonal().all() or local[:, ::-1].diagonal().all())
     line_dir = (
         "horizontal" if is_hline else
         "vertical" if is_vline else
         "diagonal" if is_diag else "none"
     )
 
-    rows = [cell[0] for cell in obj.cells]
-    cols = [cell[1] for cell in obj.cells]
-    centroid = (float(np.mean(rows)), float(np.mean(cols)))
+    centroid = (float(obj.rows.mean()), float(obj.cols.mean()))
 
     return ObjectSignature(
         colour=obj.colour,
@@ -104,7 +114,8 @@ def compute_object_signature(obj: GridObject) -> ObjectSignature:
 
 def objects_same_shape(sig_a: ObjectSignature, sig_b: ObjectSignature) -> bool:
     """Return True if both objects have identical normalised shapes."""
-    return sig_a.normalized_shape == sig_b.normalized_shape
+    a, b = sig_a.normalized_shape, sig_b.normalized_shape
+    return a is b or a == b
 
 
 def objects_same_size(sig_a: ObjectSignature, sig_b: ObjectSignature) -> bool:
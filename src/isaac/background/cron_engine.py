@@ -15,13 +15,16 @@ Features
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import os
+import tempfile
 import threading
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
@@ -45,6 +48,8 @@ class CronTask:
     enabled: bool = True
     last_run: str = ""  # ISO datetime
     last_status: str = ""  # "ok" | "error" | ""
+    next_run: str = ""  # ISO datetime, computed when the task fires
+    next_run_ts: float = 0.0  # next_run as POSIX seconds (cheap due check)
     created_at: str = field(
         default_factory=lambda: datetime.now(timezone.utc).isoformat()
     )
@@ -80,16 +85,61 @@ def _log_path() -> Path:
     return _isaac_home() / "cron_execution.log"
 
 
+# Execution log descriptor, opened once with O_APPEND and kept for the
+# process lifetime (reopened if the log path changes, the file at that path
+# is no longer the one we hold open, or a write fails).
+_log_lock = threading.Lock()
+_log_fd: tuple[Path, int] | None = None
+
+
+def _is_open_file(path: Path, fd: int) -> bool:
+    """``True`` if *fd* still refers to the file currently at *path*.
+
+    Writes to a renamed or unlinked file succeed, so log rotation can only
+    be noticed by comparing inodes.
+    """
+    try:
+        on_disk = os.stat(path)
+        held = os.fstat(fd)
+    except OSError:
+        return False
+    return (on_disk.st_dev, on_disk.st_ino) == (held.st_dev, held.st_ino)
+
+
+def _log_descriptor(path: Path) -> int:
+    global _log_fd
+    if _log_fd is not None and _log_fd[0] == path and _is_open_file(path, _log_fd[1]):
+        return _log_fd[1]
+    _close_log()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    _log_fd = (path, fd)
+    return fd
+
+
+def _close_log() -> None:
+    global _log_fd
+    if _log_fd is not None:
+        with contextlib.suppress(OSError):
+            os.close(_log_fd[1])
+        _log_fd = None
+
+
 def _append_log(task_id: str, status: str, detail: str = "") -> None:
     try:
         path = _log_path()
-        path.parent.mkdir(parents=True, exist_ok=True)
         ts = datetime.now(timezone.utc).isoformat()
         line = f"{ts}  task={task_id}  status={status}"
         if detail:
             line += f"  detail={detail[:300]}"
-        with path.open("a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        data = (line + "\n").encode("utf-8")
+        with _log_lock:
+            try:
+                os.write(_log_descriptor(path), data)
+            except OSError:
+                # Descriptor closed underneath us; reopen and retry once.
+                _close_log()
+                os.write(_log_descriptor(path), data)
     except Exception:
         pass
 
@@ -99,27 +149,59 @@ def _append_log(task_id: str, status: str, detail: str = "") -> None:
 # ---------------------------------------------------------------------------
 
 
+# Parsed manifest, keyed by (path, st_ino, st_mtime_ns, st_size) of the file
+# it was read from or written to.  ``save_tasks`` swaps in a new inode, so a
+# rewrite is noticed even when mtime granularity hides it.  Callers always get
+# fresh copies of the tasks.
+_manifest_cache: tuple[tuple[Path, int, int, int], list[CronTask]] | None = None
+
+
+def _manifest_key(path: Path) -> tuple[Path, int, int, int]:
+    st = path.stat()
+    return (path, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
 def load_tasks() -> list[CronTask]:
-    """Load tasks from the JSON manifest."""
+    """Load tasks from the JSON manifest.
+
+    The parsed manifest is cached until the file's inode, mtime or size changes.
+    """
+    global _manifest_cache
     path = _manifest_path()
     if not path.exists():
         return []
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return [_task_from_dict(d) for d in data]
+        key = _manifest_key(path)
+        cached = _manifest_cache
+        if cached is None or cached[0] != key:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            cached = _manifest_cache = (key, [_task_from_dict(d) for d in data])
+        return [replace(t) for t in cached[1]]
     except Exception as exc:
         logger.error("Failed to load cron tasks: %s", exc)
         return []
 
 
 def save_tasks(tasks: list[CronTask]) -> None:
-    """Persist tasks to the JSON manifest."""
+    """Persist tasks to the JSON manifest.
+
+    Written to a uniquely named sibling temp file and moved into place with
+    ``os.replace``, so concurrent writers never share a temp file and readers
+    (the daemon, a CLI call) never see a half-written manifest.
+    """
+    global _manifest_cache
     path = _manifest_path()
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps([asdict(t) for t in tasks], indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump([asdict(t) for t in tasks], fh, indent=2, ensure_ascii=False)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+    _manifest_cache = (_manifest_key(path), [replace(t) for t in tasks])
 
 
 # ---------------------------------------------------------------------------
@@ -154,26 +236,25 @@ def remove_task(task_id: str) -> bool:
     return True
 
 
-def pause_task(task_id: str) -> bool:
-    """Disable a task by id.  Returns True if found."""
+def _set_enabled(task_id: str, enabled: bool) -> bool:
     tasks = load_tasks()
     for t in tasks:
         if t.id == task_id:
-            t.enabled = False
-            save_tasks(tasks)
+            if t.enabled != enabled:
+                t.enabled = enabled
+                save_tasks(tasks)
             return True
     return False
 
 
+def pause_task(task_id: str) -> bool:
+    """Disable a task by id.  Returns True if found."""
+    return _set_enabled(task_id, False)
+
+
 def resume_task(task_id: str) -> bool:
     """Re-enable a task by id.  Returns True if found."""
-    tasks = load_tasks()
-    for t in tasks:
-        if t.id == task_id:
-            t.enabled = True
-            save_tasks(tasks)
-            return True
-    return False
+    return _set_enabled(task_id, True)
 
 
 def list_tasks() -> list[dict[str, Any]]:
@@ -186,6 +267,27 @@ def list_tasks() -> list[dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=256)
+def _parse_command(command: str) -> tuple[str, tuple[tuple[str, str], ...]] | None:
+    """Split a ``connector:action key=val`` command into (connector, kwargs).
+
+    Returns ``None`` for commands that are not connector-style.  Cached per
+    command string, so a task firing every minute is parsed once.
+    """
+    if ":" not in command or command.startswith("http"):
+        return None
+    connector_name, rest = (part.strip() for part in command.split(":", 1))
+
+    kwargs: dict[str, str] = {}
+    for token in rest.split():
+        if "=" in token:
+            k, v = token.split("=", 1)
+            kwargs[k] = v
+        else:
+            kwargs.setdefault("query", token)
+    return connector_name, tuple(kwargs.items())
+
+
 def _execute_task(task: CronTask) -> str:
     """Execute a single cron task.  Returns status string."""
     logger.info("Cron executing: %s (%s)", task.id, task.name)
@@ -194,21 +296,10 @@ def _execute_task(task: CronTask) -> str:
     try:
         from isaac.skills.connectors.registry import run_connector
 
-        # If the command looks like `connector:action key=val`, parse it
-        if ":" in task.command and not task.command.startswith("http"):
-            parts = task.command.split(":", 1)
-            connector_name = parts[0].strip()
-            rest = parts[1].strip()
-
-            kwargs: dict[str, Any] = {}
-            for token in rest.split():
-                if "=" in token:
-                    k, v = token.split("=", 1)
-                    kwargs[k] = v
-                else:
-                    kwargs.setdefault("query", token)
-
-            result = run_connector(connector_name, **kwargs)
+        parsed = _parse_command(task.command)
+        if parsed is not None:
+            connector_name, kwargs = parsed
+            result = run_connector(connector_name, **dict(kwargs))
             _append_log(task.id, "ok", json.dumps(result)[:300])
             return "ok"
     except Exception as exc:
@@ -227,26 +318,47 @@ def _execute_task(task: CronTask) -> str:
         return "error"
 
 
-def _is_due(task: CronTask) -> bool:
-    """Check if *task* is due based on its cron schedule and last_run."""
+def _next_run(schedule: str, after: datetime) -> datetime | None:
+    """First firing time of *schedule* after *after*; ``None`` without croniter."""
     try:
         from croniter import croniter  # type: ignore[import-untyped]
     except ImportError:
         logger.warning("croniter not installed — cron tasks will not fire.")
-        return False
-
-    now = datetime.now(timezone.utc)
-    if task.last_run:
-        last = datetime.fromisoformat(task.last_run)
-    else:
-        # Never ran: consider it due immediately
-        return True
+        return None
 
-    cron = croniter(task.schedule, last)
-    next_run = cron.get_next(datetime)
+    next_run = croniter(schedule, after).get_next(datetime)
     if next_run.tzinfo is None:
         next_run = next_run.replace(tzinfo=timezone.utc)
-    return now >= next_run
+    return next_run
+
+
+def _is_due(task: CronTask) -> bool:
+    """Check if *task* is due based on its cron schedule and last_run.
+
+    Compares the clock against the ``next_run_ts`` epoch stored when the
+    task last fired, so the common "not due yet" path is one float compare
+    with no croniter or datetime work.  Tasks saved before these fields
+    existed get them derived here once and kept on the task object.  A task
+    whose schedule croniter rejects is never due.
+    """
+    try:
+        if not task.last_run:
+            # Never ran: consider it due immediately
+            return _next_run(task.schedule, datetime.now(timezone.utc)) is not None
+        if not task.next_run_ts:
+            if task.next_run:
+                next_run = datetime.fromisoformat(task.next_run)
+            else:
+                next_run = _next_run(task.schedule, datetime.fromisoformat(task.last_run))
+                if next_run is None:
+                    return False
+                task.next_run = next_run.isoformat()
+            task.next_run_ts = next_run.timestamp()
+    except (ValueError, KeyError) as exc:
+        # croniter's CroniterError family subclasses ValueError.
+        logger.warning("Cron task %s has an invalid schedule %r: %s", task.id, task.schedule, exc)
+        return False
+    return time.time() >= task.next_run_ts
 
 
 # ---------------------------------------------------------------------------
@@ -257,27 +369,54 @@ _stop_event = threading.Event()
 _daemon_thread: threading.Thread | None = None
 
 
+def _run_due_tasks() -> None:
+    """One daemon tick: execute every enabled, due task.
+
+    The manifest is read once per tick and written back at most once.  The
+    write re-reads the manifest first so tasks added or removed while the
+    tick was executing are not clobbered; only ``last_run``, ``last_status``
+    and ``next_run``/``next_run_ts`` of the tasks that fired are merged in.
+    A task that raises is logged and skipped, and whatever already fired is
+    saved even if the tick itself is interrupted, so it does not re-fire.
+    """
+    results: dict[str, tuple[str, str, str, float]] = {}
+    try:
+        for task in load_tasks():
+            if _stop_event.is_set():
+                break
+            if not task.enabled:
+                continue
+            try:
+                if not _is_due(task):
+                    continue
+                status = _execute_task(task)
+                now = datetime.now(timezone.utc)
+                results[task.id] = (now.isoformat(), status, "", 0.0)
+                next_run = _next_run(task.schedule, now)
+                if next_run is not None:
+                    results[task.id] = (
+                        now.isoformat(),
+                        status,
+                        next_run.isoformat(),
+                        next_run.timestamp(),
+                    )
+            except Exception as exc:
+                logger.error("Cron task %s failed: %s", task.id, exc)
+    finally:
+        if results:
+            all_tasks = load_tasks()
+            for t in all_tasks:
+                if t.id in results:
+                    t.last_run, t.last_status, t.next_run, t.next_run_ts = results[t.id]
+            save_tasks(all_tasks)
+
+
 def _daemon_loop(poll_seconds: int = 30) -> None:
     """Main loop: polls tasks file and executes due tasks."""
     logger.info("Cron daemon loop started (poll=%ds).", poll_seconds)
     while not _stop_event.is_set():
         try:
-            tasks = load_tasks()
-            for task in tasks:
-                if _stop_event.is_set():
-                    break
-                if not task.enabled:
-                    continue
-                if _is_due(task):
-                    status = _execute_task(task)
-                    # reload & update persisted state
-                    all_tasks = load_tasks()
-                    for t in all_tasks:
-                        if t.id == task.id:
-                            t.last_run = datetime.now(timezone.utc).isoformat()
-                            t.last_status = status
-                            break
-                    save_tasks(all_tasks)
+            _run_due_tasks()
         except Exception as exc:
             logger.error("Cron daemon tick error: %s", exc)
 
@@ -329,6 +468,9 @@ def stop_cron_daemon() -> None:
         _daemon_thread.join(timeout=5)
         _daemon_thread = None
 
+    with _log_lock:
+        _close_log()
+
     pid_path = _pid_path()
     pid_path.unlink(missing_ok=True)
     logger.info("Cron daemon stopped.")
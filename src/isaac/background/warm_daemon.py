@@ -0,0 +1,245 @@
+"""Warm daemon — keep expensive singletons loaded between CLI invocations.
+
+``isaac memory``, ``isaac tokens list`` and ``isaac audit`` are often run
+back-to-back from shell scripts, and each run pays for settings parsing,
+store loading and (for memory) embedding-model start-up.  ``isaac daemon
+start`` launches a background process that holds those singletons and
+answers read-only queries over a Unix socket at ``~/.isaac/isaacd.sock``
+(``$ISAAC_HOME/isaacd.sock`` when that variable is set).  Client and
+daemon resolve the path with the same environment-only lookup, so an
+``isaac_home`` set only in ``.env`` does not move the socket.
+
+Protocol
+--------
+One JSON request per connection, newline-terminated::
+
+    {"cmd": "tokens.list"}
+    {"cmd": "memory.recall", "query": "...", "k": 5}
+
+answered with ``{"ok": true, "output": "..."}`` or
+``{"ok": false, "error": "..."}``.  :func:`request` returns ``None`` on any
+failure, so callers always fall back to the in-process path.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_CONNECT_TIMEOUT = 0.5
+_REQUEST_TIMEOUT = 60.0
+_START_TIMEOUT = 10.0
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _socket_path() -> Path:
+    # Resolved without loading settings: the client side must stay cheap, so
+    # only the environment variable behind ``Settings.isaac_home`` is honoured
+    # (not ``.env``).  The daemon inherits the client's environment, so both
+    # sides always agree.
+    home = os.environ.get("ISAAC_HOME")
+    return (Path(home).expanduser() if home else Path.home() / ".isaac") / "isaacd.sock"
+
+
+def _supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+# ---------------------------------------------------------------------------
+# Request handlers (run inside the daemon)
+# ---------------------------------------------------------------------------
+
+
+def _memory_recall(req: dict[str, Any]) -> str:
+    from isaac.memory.manager import get_memory_manager
+
+    result = get_memory_manager().recall(req.get("query", "recent"), k=int(req.get("k", 5)))
+    return result.combined_context or "No memories found."
+
+
+def _tokens_list(req: dict[str, Any]) -> str:
+    from isaac.cli._cmd_tokens import active_token_lines
+    from isaac.security.capabilities import TokenStore
+
+    # Other processes issue and revoke tokens, so re-read the store file
+    # rather than trusting a long-lived in-memory copy.
+    return "\n".join(active_token_lines(TokenStore())) or "No active tokens."
+
+
+def _audit_recent(req: dict[str, Any]) -> str:
+    from isaac.cli._cmd_audit import recent_entry_lines
+    from isaac.security.audit import get_audit_log
+
+    return "\n".join(recent_entry_lines(get_audit_log(), int(req.get("n", 10)))) or (
+        "No audit entries."
+    )
+
+
+_HANDLERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "ping": lambda req: "pong",
+    "memory.recall": _memory_recall,
+    "tokens.list": _tokens_list,
+    "audit.recent": _audit_recent,
+}
+
+
+def handle_request(req: dict[str, Any]) -> dict[str, Any]:
+    """Dispatch one decoded request to its handler."""
+    handler = _HANDLERS.get(req.get("cmd", ""))
+    if handler is None:
+        return {"ok": False, "error": f"unknown command: {req.get('cmd')!r}"}
+    try:
+        return {"ok": True, "output": handler(req)}
+    except Exception as exc:
+        logger.exception("Daemon request %r failed.", req.get("cmd"))
+        return {"ok": False, "error": str(exc)}
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+def _warm_up() -> None:
+    """Load the singletons the handlers use so the first request is fast."""
+    for module, loader in (
+        ("isaac.config.settings", "get_settings"),
+        ("isaac.security.audit", "get_audit_log"),
+        ("isaac.memory.manager", "get_memory_manager"),
+    ):
+        try:
+            getattr(importlib.import_module(module), loader)()
+        except Exception as exc:
+            logger.warning("Daemon warm-up step %s failed: %s", loader, exc)
+
+
+def serve(path: Path | None = None) -> None:
+    """Run the daemon in the foreground until a ``shutdown`` request arrives."""
+    path = path or _socket_path()
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+
+    _warm_up()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        # Create the socket owner-only from the start; a chmod after bind
+        # would leave a window in which other local users could connect.
+        old_umask = os.umask(0o077)
+        try:
+            server.bind(str(path))
+        finally:
+            os.umask(old_umask)
+        server.listen()
+        logger.info("Warm daemon listening on %s (PID %d).", path, os.getpid())
+        while _serve_one(server):
+            pass
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
+        logger.info("Warm daemon stopped.")
+
+
+def _serve_one(server: socket.socket) -> bool:
+    """Answer one connection.  Returns ``False`` once asked to shut down."""
+    conn, _ = server.accept()
+    try:
+        with conn, conn.makefile("rwb") as stream:
+            try:
+                req = json.loads(stream.readline() or b"{}")
+            except ValueError:
+                req = {}
+            if req.get("cmd") == "shutdown":
+                stream.write(b'{"ok": true, "output": "stopping"}\n')
+                return False
+            stream.write(json.dumps(handle_request(req)).encode() + b"\n")
+    except OSError as exc:
+        logger.debug("Daemon client went away: %s", exc)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+def request(cmd: str, **params: Any) -> str | None:
+    """Send *cmd* to a running daemon; ``None`` if it is absent or fails."""
+    path = _socket_path()
+    if not _supported() or not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_CONNECT_TIMEOUT)
+            sock.connect(str(path))
+            sock.settimeout(_REQUEST_TIMEOUT)
+            with sock.makefile("rwb") as stream:
+                stream.write(json.dumps({"cmd": cmd, **params}).encode() + b"\n")
+                stream.flush()
+                reply = json.loads(stream.readline())
+    except (OSError, ValueError) as exc:
+        logger.debug("Warm daemon unavailable (%s); running in-process.", exc)
+        return None
+    if not reply.get("ok"):
+        logger.debug("Warm daemon error for %s: %s", cmd, reply.get("error"))
+        return None
+    return reply.get("output")
+
+
+def is_daemon_running() -> bool:
+    return request("ping") == "pong"
+
+
+def start_daemon() -> bool:
+    """Launch the daemon as a detached process and wait until it answers."""
+    if not _supported():
+        logger.warning("Warm daemon needs Unix domain sockets; not available here.")
+        return False
+    if is_daemon_running():
+        return True
+
+    log_path = _socket_path().with_name("isaacd.log")
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "ab") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "isaac.background.warm_daemon"],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + _START_TIMEOUT
+    while time.monotonic() < deadline:
+        if is_daemon_running():
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def stop_daemon() -> bool:
+    """Ask a running daemon to exit.  Returns ``False`` if none was running."""
+    return request("shutdown") is not None
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s  %(name)-30s  %(levelname)-7s  %(message)s",
+    )
+    serve()
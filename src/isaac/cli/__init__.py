@@ -0,0 +1,88 @@
+"""I.S.A.A.C. CLI — Typer-based unified entry point.
+
+Commands
+--------
+run         Start the interactive cognitive loop (default).
+serve       Start the Telegram gateway + heartbeat scheduler.
+audit       View / verify the audit log.
+memory      Query the memory layers.
+tools       List registered tools.
+tokens      Manage capability tokens.
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import Any
+
+
+def _setup_logging(verbose: bool = False) -> None:
+    level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s  %(name)-30s  %(levelname)-7s  %(message)s",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Commands
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=1)
+def _build_app() -> Any | None:
+    """Build the Typer app; ``None`` if Typer is missing.
+
+    Deferred until :func:`main` (or first access to ``isaac.cli.app``) so
+    importing this module stays cheap.  The app's group resolves each
+    subcommand from its ``isaac.cli._cmd_<name>`` module only when that
+    command is dispatched (see :mod:`isaac.cli._lazy`).
+    """
+    try:
+        import typer  # type: ignore[import-untyped]
+    except ImportError:
+        # Fallback: if Typer is not installed, provide a minimal CLI via argparse
+        return None
+
+    from isaac.cli._lazy import LazyTyperGroup
+
+    app = typer.Typer(
+        name="isaac",
+        help="I.S.A.A.C. — Intelligent System for Autonomous Action and Cognition",
+        add_completion=False,
+        cls=LazyTyperGroup,
+        # Plain Click formatting for the top-level help: Typer's Rich
+        # renderer imports rich.markdown / pygments (~150ms) just to draw
+        # the command table.
+        rich_markup_mode=None,
+    )
+
+    @app.callback()
+    def _root() -> None:
+        pass
+
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    if name == "app":
+        return _build_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main() -> int:
+    """Entry point — delegates to Typer if available, else basic argparse."""
+    app = _build_app()
+    if app is not None:
+        app()
+        return 0
+    else:
+        # Fallback for environments without Typer — use Rich REPL
+        _setup_logging()
+        try:
+            from isaac.interfaces.repl import run_repl
+            return run_repl()
+        except ImportError:
+            from isaac.core.graph import build_and_run
+            return build_and_run()
@@ -0,0 +1,69 @@
+"""``isaac audit`` — view or verify the audit log."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import typer  # type: ignore[import-untyped]
+
+from isaac.cli import _setup_logging
+
+app = typer.Typer(add_completion=False)
+
+
+def recent_entry_lines(log: Any, n: int) -> list[str]:
+    """Render the last *n* audit entries (shared with the warm daemon)."""
+    lines: list[str] = []
+    for entry in log.recent(n):
+        lines.append(
+            f"[{entry.timestamp}] {entry.category}/{entry.action} "
+            f"actor={entry.actor} hash={entry.entry_hash[:12]}..."
+        )
+        if entry.details:
+            lines.append(f"  details: {entry.details}")
+    return lines
+
+
+@app.command()
+def audit(
+    verify: bool = typer.Option(False, "--verify", help="Verify audit chain integrity."),
+    last: int = typer.Option(10, "--last", "-n", help="Show last N entries."),
+    parallel: bool = typer.Option(
+        False, "--parallel", help="Verify the full chain across all CPU cores.",
+    ),
+    verify_last: int = typer.Option(
+        0, "--verify-last", help="Verify only the last N entries of the chain.",
+    ),
+) -> None:
+    """View or verify the audit log."""
+    _setup_logging()
+    if not (verify or parallel or verify_last):
+        from isaac.background.warm_daemon import request
+
+        output = request("audit.recent", n=last)
+        if output is not None:
+            typer.echo(output)
+            return
+
+    from isaac.security.audit import get_audit_log
+
+    log = get_audit_log()
+
+    if verify or parallel or verify_last:
+        if verify_last:
+            valid, count = log.verify_chain_tail(verify_last)
+        elif parallel:
+            valid, count = log.verify_chain_parallel()
+        else:
+            valid, count = log.verify_chain()
+        status = "VALID" if valid else "BROKEN"
+        typer.echo(f"Audit chain: {status} ({count} entries verified)")
+        if not valid:
+            raise typer.Exit(1)
+    else:
+        # Collect rows and echo once rather than one flushed write per row.
+        lines = recent_entry_lines(log, last)
+        typer.echo("\n".join(lines) if lines else "No audit entries.")
+
+
+cmd = typer.main.get_command(app)
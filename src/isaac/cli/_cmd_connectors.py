@@ -0,0 +1,31 @@
+"""``isaac connectors`` — list all registered connectors and their availability."""
+
+from __future__ import annotations
+
+import typer  # type: ignore[import-untyped]
+
+from isaac.cli import _setup_logging
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def connectors() -> None:
+    """List all registered connectors and their availability."""
+    _setup_logging()
+    from isaac.skills.connectors.registry import get_registry
+
+    reg = get_registry()
+    if not reg:
+        typer.echo("No connectors found.")
+        return
+
+    lines: list[str] = []
+    for name, connector in sorted(reg.items()):
+        avail = "✓" if connector.is_available() else "✗"
+        env = ", ".join(connector.requires_env) if connector.requires_env else "none"
+        lines.append(f"  [{avail}] {name:15s}  env={env:30s}  {connector.description[:50]}")
+    typer.echo("\n".join(lines))
+
+
+cmd = typer.main.get_command(app)
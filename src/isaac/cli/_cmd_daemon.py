@@ -0,0 +1,33 @@
+"""``isaac daemon`` — manage the warm background daemon."""
+
+from __future__ import annotations
+
+import typer  # type: ignore[import-untyped]
+
+from isaac.cli import _setup_logging
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def daemon(
+    action: str = typer.Argument("status", help="Action: start, stop, status."),
+) -> None:
+    """Keep memory, tokens and audit log loaded between CLI calls."""
+    _setup_logging()
+    from isaac.background.warm_daemon import is_daemon_running, start_daemon, stop_daemon
+
+    if action == "start":
+        if not start_daemon():
+            typer.echo("Warm daemon failed to start (see ~/.isaac/isaacd.log).")
+            raise typer.Exit(1)
+        typer.echo("Warm daemon started.")
+    elif action == "stop":
+        typer.echo("Warm daemon stopped." if stop_daemon() else "Warm daemon not running.")
+    elif action == "status":
+        typer.echo(f"Warm daemon: {'RUNNING' if is_daemon_running() else 'STOPPED'}")
+    else:
+        typer.echo(f"Unknown action: {action}")
+
+
+cmd = typer.main.get_command(app)
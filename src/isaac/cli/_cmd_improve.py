@@ -0,0 +1,43 @@
+"""``isaac improve`` — run one self-improvement cycle (curation + critique + telemetry prune)."""
+
+from __future__ import annotations
+
+import typer  # type: ignore[import-untyped]
+
+from isaac.cli import _setup_logging
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def improve(
+    report: bool = typer.Option(False, "--report", "-r", help="Print the last critique report."),
+    verbose: bool = typer.Option(False, "--verbose", "-v"),
+) -> None:
+    """Run one self-improvement cycle (curation + critique + telemetry prune)."""
+    _setup_logging(verbose)
+    from isaac.improvement import run_improvement_cycle
+
+    result = run_improvement_cycle()
+    promoted = sum(1 for d in result.curation_decisions if d.get("action") == "promote")
+    deprecated = sum(1 for d in result.curation_decisions if d.get("action") == "deprecate")
+    typer.echo(
+        f"Improvement cycle complete in {result.finished_at - result.started_at:.1f}s — "
+        f"promoted={promoted}, deprecated={deprecated}, pruned_rows={result.pruned_rows}"
+    )
+    if result.critique_summary:
+        typer.echo(f"\nCritique: {result.critique_summary}")
+    if result.critique_action:
+        typer.echo(f"Suggested action: {result.critique_action}")
+    if result.errors:
+        typer.echo(f"\nErrors during cycle: {result.errors}")
+    if report and result.curation_decisions:
+        typer.echo("\nCuration decisions:")
+        for d in result.curation_decisions:
+            typer.echo(
+                f"  - {d['action']:10s} {d['skill_name']}  "
+                f"(runs={d['runs']}, sr={d['success_rate']:.2f})"
+            )
+
+
+cmd = typer.main.get_command(app)
@@ -0,0 +1,33 @@
+"""``isaac memory`` — query the unified memory system."""
+
+from __future__ import annotations
+
+import typer  # type: ignore[import-untyped]
+
+from isaac.cli import _setup_logging
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def memory(
+    query: str = typer.Argument("recent", help="Search query for memory recall."),
+    k: int = typer.Option(5, "--k", help="Number of results per layer."),
+) -> None:
+    """Query the unified memory system."""
+    _setup_logging()
+    from isaac.background.warm_daemon import request
+
+    output = request("memory.recall", query=query, k=k)
+    if output is not None:
+        typer.echo(output)
+        return
+
+    from isaac.memory.manager import get_memory_manager
+
+    mm = get_memory_manager()
+    result = mm.recall(query, k=k)
+    typer.echo(result.combined_context or "No memories found.")
+
+
+cmd = typer.main.get_command(app)
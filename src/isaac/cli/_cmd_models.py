@@ -0,0 +1,36 @@
+"""``isaac models`` — list available providers and detect locally-installed models."""
+
+from __future__ import annotations
+
+import typer  # type: ignore[import-untyped]
+
+from isaac.cli import _setup_logging
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def models() -> None:
+    """List available providers and detect locally-installed models."""
+    _setup_logging()
+    from isaac.config.settings import settings
+    from isaac.llm.providers import LOCAL_PROVIDERS, PROVIDERS
+    from isaac.llm.providers.ollama import health_check
+    from isaac.llm.providers.ollama import list_models as list_ollama_models
+
+    typer.echo("Registered providers:")
+    for name in sorted(PROVIDERS):
+        tag = "local" if name in LOCAL_PROVIDERS else "cloud"
+        typer.echo(f"  - {name:15s} [{tag}]")
+
+    typer.echo("\nOllama:")
+    if health_check(settings.ollama_base_url):
+        tags = list_ollama_models(settings.ollama_base_url)
+        typer.echo(f"  reachable at {settings.ollama_base_url}")
+        for t in tags:
+            typer.echo(f"    - {t}")
+    else:
+        typer.echo(f"  not reachable at {settings.ollama_base_url}")
+
+
+cmd = typer.main.get_command(app)
@@ -0,0 +1,40 @@
+"""``isaac run`` — start the interactive cognitive loop (REPL)."""
+
+from __future__ import annotations
+
+import typer  # type: ignore[import-untyped]
+
+from isaac.cli import _setup_logging
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def run(
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging."),
+    classic: bool = typer.Option(False, "--classic", help="Use the classic plain-text REPL."),
+) -> None:
+    """Start the interactive cognitive loop (REPL)."""
+    _setup_logging(verbose)
+
+    if classic:
+        # Legacy plain-text REPL
+        from isaac.core.graph import build_and_run
+        from isaac.scheduler.heartbeat import start_scheduler, stop_scheduler
+        from isaac.tools import register_all_tools
+
+        register_all_tools()
+        start_scheduler()
+        try:
+            code = build_and_run()
+        finally:
+            stop_scheduler()
+        raise typer.Exit(code)
+
+    # Rich terminal UI (default)
+    from isaac.interfaces.repl import run_repl
+    code = run_repl()
+    raise typer.Exit(code)
+
+
+cmd = typer.main.get_command(app)
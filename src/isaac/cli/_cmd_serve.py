@@ -0,0 +1,36 @@
+"""``isaac serve`` — start the Telegram gateway + heartbeat scheduler (daemon mode)."""
+
+from __future__ import annotations
+
+import typer  # type: ignore[import-untyped]
+
+from isaac.cli import _setup_logging
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def serve(
+    verbose: bool = typer.Option(False, "--verbose", "-v"),
+) -> None:
+    """Start the Telegram gateway + heartbeat scheduler (daemon mode)."""
+    _setup_logging(verbose)
+    import asyncio
+
+    from isaac.interfaces.telegram_gateway import start_bot
+    from isaac.scheduler.heartbeat import start_scheduler, stop_scheduler
+    from isaac.tools import register_all_tools
+
+    register_all_tools()
+    start_scheduler()
+
+    typer.echo("Starting Telegram gateway... Press Ctrl+C to stop.")
+    try:
+        asyncio.run(start_bot())
+    except KeyboardInterrupt:
+        typer.echo("\nShutting down.")
+    finally:
+        stop_scheduler()
+
+
+cmd = typer.main.get_command(app)
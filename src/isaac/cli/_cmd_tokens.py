@@ -0,0 +1,64 @@
+"""``isaac tokens`` — manage capability tokens."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import typer  # type: ignore[import-untyped]
+
+from isaac.cli import _setup_logging
+
+app = typer.Typer(add_completion=False)
+
+
+def active_token_lines(store: Any) -> list[str]:
+    """Render one line per active token (shared with the warm daemon)."""
+    return [
+        f"  {t.token_id[:12]}...  tool={t.tool_name}  "
+        f"action={t.action}  uses={t.use_count}/{t.max_uses or '∞'}  "
+        f"expires={t.expires_at}"
+        for t in store.list_active()
+    ]
+
+
+@app.command()
+def tokens(
+    action: str = typer.Argument("list", help="Action: list, issue, revoke, cleanup."),
+    tool_name: str = typer.Option("*", "--tool", help="Tool name for issue/revoke."),
+    token_id: str = typer.Option("", "--id", help="Token ID for revoke."),
+    ttl: int = typer.Option(24, "--ttl", help="TTL in hours for issue."),
+) -> None:
+    """Manage capability tokens."""
+    _setup_logging()
+    if action == "list":
+        from isaac.background.warm_daemon import request
+
+        output = request("tokens.list")
+        if output is not None:
+            typer.echo(output)
+            return
+
+    from isaac.security.capabilities import get_token_store
+
+    store = get_token_store()
+
+    if action == "list":
+        lines = active_token_lines(store)
+        typer.echo("\n".join(lines) if lines else "No active tokens.")
+    elif action == "issue":
+        token = store.issue(tool_name, ttl_hours=ttl, issued_by="cli")
+        typer.echo(f"Issued token: {token.token_id}")
+    elif action == "revoke":
+        if not token_id:
+            typer.echo("Provide --id to revoke.")
+            raise typer.Exit(1)
+        ok = store.revoke(token_id, revoked_by="cli")
+        typer.echo("Revoked." if ok else "Token not found.")
+    elif action == "cleanup":
+        n = store.cleanup_expired()
+        typer.echo(f"Cleaned up {n} expired tokens.")
+    else:
+        typer.echo(f"Unknown action: {action}")
+
+
+cmd = typer.main.get_command(app)
@@ -0,0 +1,37 @@
+"""``isaac tools`` — list all registered tools."""
+
+from __future__ import annotations
+
+import typer  # type: ignore[import-untyped]
+
+from isaac.cli import _setup_logging
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def tools() -> None:
+    """List all registered tools."""
+    _setup_logging()
+    from isaac.tools import register_all_tools
+    from isaac.tools.base import get_tool_registry
+
+    register_all_tools()
+    registry = get_tool_registry()
+    all_tools = registry.list_all()
+
+    if not all_tools:
+        typer.echo("No tools registered.")
+        return
+
+    lines: list[str] = []
+    for tool in all_tools:
+        approval = " [APPROVAL REQUIRED]" if tool.requires_approval else ""
+        sandbox = " [SANDBOX]" if tool.sandbox_required else ""
+        lines.append(
+            f"  {tool.name:20s} risk={tool.risk_level}  {tool.description[:60]}{approval}{sandbox}"
+        )
+    typer.echo("\n".join(lines))
+
+
+cmd = typer.main.get_command(app)
@@ -0,0 +1,34 @@
+"""``isaac vision`` — ask the local vision-language model a question about an image."""
+
+from __future__ import annotations
+
+import typer  # type: ignore[import-untyped]
+
+from isaac.cli import _setup_logging
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def vision(
+    image: str = typer.Argument(..., help="Path or URL of the image to analyse."),
+    prompt: str = typer.Option(
+        "Describe this image in detail.",
+        "--prompt", "-p",
+        help="Question to ask about the image.",
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v"),
+) -> None:
+    """Ask the local vision-language model a question about an image."""
+    _setup_logging(verbose)
+    from isaac.multimodal.vision.vision_lm import get_vision_lm
+
+    try:
+        answer = get_vision_lm().ask(prompt, image)
+    except Exception as exc:
+        typer.echo(f"Vision call failed: {exc}", err=True)
+        raise typer.Exit(1) from exc
+    typer.echo(answer)
+
+
+cmd = typer.main.get_command(app)
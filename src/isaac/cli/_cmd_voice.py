@@ -0,0 +1,30 @@
+"""``isaac voice`` — start the conversational voice REPL."""
+
+from __future__ import annotations
+
+import typer  # type: ignore[import-untyped]
+
+from isaac.cli import _setup_logging
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def voice(
+    hands_free: bool = typer.Option(False, "--hands-free", "-f", help="Continuous listening mode."),
+    verbose: bool = typer.Option(False, "--verbose", "-v"),
+) -> None:
+    """Start the conversational voice REPL (mic ↔ STT ↔ agent ↔ TTS ↔ speaker)."""
+    _setup_logging(verbose)
+    try:
+        from isaac.tools import register_all_tools
+        register_all_tools()
+    except Exception:
+        pass
+    from isaac.interfaces.voice_repl import run_voice_repl
+
+    code = run_voice_repl(hands_free=hands_free)
+    raise typer.Exit(code)
+
+
+cmd = typer.main.get_command(app)
@@ -0,0 +1,44 @@
+"""Lazy subcommand loading for the ``isaac`` CLI.
+
+Each subcommand lives in its own ``isaac.cli._cmd_<name>`` module exposing a
+Click command as ``cmd``.  :class:`LazyTyperGroup` imports that module only
+when the command is dispatched (or its help line is rendered), so running
+one command never builds the others.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+from typer.core import TyperGroup  # type: ignore[import-untyped]
+
+# Subcommand name → module under ``isaac.cli``, in ``--help`` order.
+LAZY_COMMANDS: dict[str, str] = {
+    "run": "_cmd_run",
+    "serve": "_cmd_serve",
+    "audit": "_cmd_audit",
+    "memory": "_cmd_memory",
+    "tools": "_cmd_tools",
+    "cron": "_cmd_cron",
+    "connectors": "_cmd_connectors",
+    "voice": "_cmd_voice",
+    "vision": "_cmd_vision",
+    "improve": "_cmd_improve",
+    "models": "_cmd_models",
+    "tokens": "_cmd_tokens",
+    "daemon": "_cmd_daemon",
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that resolves subcommands from :data:`LAZY_COMMANDS` on demand."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        return list(LAZY_COMMANDS)
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any | None:
+        module = LAZY_COMMANDS.get(cmd_name)
+        if module is None:
+            return None
+        return importlib.import_module(f"isaac.cli.{module}").cmd
@@ -0,0 +1,250 @@
+"""Pydantic models behind :mod:`isaac.config.settings`.
+
+Kept in a separate module so that importing :mod:`isaac.config.settings`
+does not pull in ``pydantic`` / ``pydantic_settings`` until the settings are
+actually needed.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# Resolve .env relative to this file so it is found regardless of CWD.
+# Layout: src/isaac/config/_models.py → src/isaac/config → src/isaac → src → project_root
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+_ENV_FILE = _PROJECT_ROOT / ".env"
+
+
+class LLMSettings(BaseSettings):
+    """LLM provider configuration.
+
+    Supports tiered models: a *fast* model for lightweight tasks (perception,
+    planning) and a *strong* model for heavy lifting (synthesis, reflection).
+    When tier-specific fields are blank, they fall back to the default model.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="ISAAC_",
+        env_file=str(_ENV_FILE),
+        env_file_encoding="utf-8",
+        protected_namespaces=("settings_",),
+        extra="ignore",
+    )
+
+    llm_provider: Literal[
+        "ollama", "llamacpp", "openai_compat", "openai", "anthropic"
+    ] = "ollama"
+    model_name: str = "qwen2.5-coder:7b"
+    temperature: float = Field(default=0.2, ge=0.0, le=2.0)
+    base_url: str = ""  # Custom API base URL (e.g. http://localhost:11434/v1 for Ollama)
+
+    # Tier overrides — leave blank to inherit from the defaults above.
+    fast_model: str = ""
+    """Lightweight model for Perception & Planner (e.g. gpt-4o-mini)."""
+    fast_temperature: float = Field(default=-1.0, ge=-1.0, le=2.0)
+    """Temperature for the fast model (-1 means inherit from ``temperature``)."""
+    strong_model: str = ""
+    """Powerful model for Synthesis & Reflection (e.g. o3, claude-3.5-sonnet)."""
+    strong_temperature: float = Field(default=-1.0, ge=-1.0, le=2.0)
+    """Temperature for the strong model (-1 means inherit from ``temperature``)."""
+
+
+class SandboxSettings(BaseSettings):
+    """Docker sandbox constraints for code-execution containers."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ISAAC_SANDBOX_",
+        env_file=str(_ENV_FILE),
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    image: str = "isaac-sandbox:latest"
+    timeout_seconds: int = Field(default=30, ge=1, le=300)
+    memory_limit: str = "256m"
+    cpu_limit: float = Field(default=1.0, ge=0.1, le=8.0)
+    pids_limit: int = Field(default=64, ge=8, le=512)
+    network: str = "none"
+    tmpfs_size: str = "64m"
+
+
+class UISandboxSettings(BaseSettings):
+    """Docker sandbox constraints for virtual-desktop Computer-Use containers."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ISAAC_UI_SANDBOX_",
+        env_file=str(_ENV_FILE),
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    image: str = "isaac-ui-sandbox:latest"
+    timeout_seconds: int = Field(default=120, ge=10, le=600)
+    memory_limit: str = "1g"
+    cpu_limit: float = Field(default=1.5, ge=0.1, le=8.0)
+    pids_limit: int = Field(default=256, ge=8, le=1024)
+    #: 'none' blocks all network; 'bridge' allows outbound (needed for browser tasks)
+    network: str = "none"
+    allow_browser_network: bool = False
+    vnc_enabled: bool = False
+    vnc_port: int = Field(default=5900, ge=1024, le=65535)
+    screen_width: int = 1280
+    screen_height: int = 720
+    screen_depth: int = 24
+    max_ui_cycles: int = Field(default=20, ge=1, le=100)
+    """Maximum screenshot→action iterations per active PlanStep."""
+
+
+class GraphSettings(BaseSettings):
+    """Cognitive-loop tuning knobs."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ISAAC_",
+        env_file=str(_ENV_FILE),
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    max_retries: int = Field(default=3, ge=1, le=20)
+    max_iterations: int = Field(default=10, ge=1, le=100)
+    max_ui_cycles: int = Field(default=20, ge=1, le=100)
+    """Upper bound on ComputerUse screenshot→action loop per step."""
+
+
+class Settings(BaseSettings):
+    """Top-level settings aggregator."""
+
+    model_config = SettingsConfigDict(
+        env_file=str(_ENV_FILE),
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    llm: LLMSettings = Field(default_factory=LLMSettings)
+    sandbox: SandboxSettings = Field(default_factory=SandboxSettings)
+    ui_sandbox: UISandboxSettings = Field(default_factory=UISandboxSettings)
+    graph: GraphSettings = Field(default_factory=GraphSettings)
+    skills_dir: Path = Field(default_factory=lambda: Path.home() / ".isaac" / "skills")
+    """Persistent skill library directory (absolute, anchored to isaac_home)."""
+
+    # API keys (read from env without prefix)
+    openai_api_key: str = ""
+    anthropic_api_key: str = ""
+
+    # Ollama-first LLM routing
+    ollama_base_url: str = "http://localhost:11434"
+    ollama_light_model: str = "qwen2.5-coder:7b"
+    ollama_heavy_model: str = "qwen2.5-coder:7b"
+    llm_fallback_provider: str = ""
+    """Fallback provider name when the primary one is unhealthy."""
+
+    # llama.cpp HTTP server
+    llamacpp_base_url: str = "http://localhost:8080"
+    llamacpp_model: str = "local-model"
+
+    # Generic OpenAI-compatible endpoint (LM Studio, vLLM, LiteLLM, ...)
+    openai_compat_base_url: str = ""
+    openai_compat_api_key: str = ""
+    openai_compat_model: str = ""
+
+    # Multimodal routing toggle
+    local_first: bool = True
+    """When True, the multimodal router prefers local backends over cloud."""
+
+    # ── Vision (multimodal) ────────────────────────────────────────────
+    vision_enabled: bool = True
+    """If False, vision routes are not registered and image input is text-only."""
+    vision_model: str = "llava:7b"
+    """Default vision-language model tag (Ollama by default)."""
+    vision_strong_model: str = ""
+    """Optional larger VLM for hard visual reasoning."""
+
+    # ── Voice (STT / TTS) ──────────────────────────────────────────────
+    voice_enabled: bool = True
+    """Master switch for the voice subsystem."""
+    voice_device: Literal["auto", "cpu", "cuda"] = "auto"
+    voice_stt_model: str = "base"
+    """faster-whisper model size (tiny / base / small / medium / large-v3)."""
+    voice_stt_language: str = ""  # auto-detect
+    voice_stt_compute_type: str = "int8"
+    voice_tts_voice: str = "en_US-lessac-medium"
+    """Piper voice file name (looked up under PIPER_VOICE_DIR or ~/.isaac/voices)."""
+    voice_tts_rate: int = 175
+    voice_tts_sample_rate: int = 22050
+
+    # ── Self-improvement engine ────────────────────────────────────────
+    improvement_enabled: bool = False
+    """When True, the scheduler runs a periodic improvement cycle."""
+    improvement_interval_minutes: int = Field(default=240, ge=10, le=10080)
+    improvement_promote_runs: int = 10
+    improvement_promote_threshold: float = Field(default=0.85, ge=0.0, le=1.0)
+    improvement_deprecate_runs: int = 8
+    improvement_deprecate_threshold: float = Field(default=0.30, ge=0.0, le=1.0)
+
+    # Telegram gateway
+    telegram_bot_token: str = ""
+    telegram_allowed_users: str = ""
+    """Comma-separated list of allowed Telegram user IDs."""
+
+    # Heartbeat scheduler
+    heartbeat_interval_minutes: int = Field(default=15, ge=1, le=1440)
+
+    # Security
+    guard_suspicion_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
+    """PromptInjectionGuard threshold (0.0–1.0). Above this → sanitize/reject."""
+
+    # Isaac workspace
+    isaac_home: Path = Path.home() / ".isaac"
+    """Root directory for Isaac persistent data (memory, audit, workspace)."""
+
+    # ── Identity & Soul ─────────────────────────────────────────────────
+    agent_name: str = "I.S.A.A.C."
+    """Display name of the agent."""
+    soul_path: str = ""
+    """Path to a custom soul JSON file (overrides built-in SOUL)."""
+
+    # ── Long-term Memory ────────────────────────────────────────────────
+    memory_db_path: str = ""
+    """SQLite DB path for long-term memory (default: ~/.isaac/long_term_memory.db)."""
+    user_profile_path: str = ""
+    """JSON file path for user profile (default: ~/.isaac/user_profile.json)."""
+    memory_consolidation_interval: int = Field(default=50, ge=5, le=1000)
+    """Number of interactions between automatic memory consolidation runs."""
+
+    # ── Connectors ──────────────────────────────────────────────────────
+    allowed_paths: list[str] = Field(default_factory=lambda: [str(Path.home())])
+    """Directories accessible by the FileSystemConnector."""
+    shell_allowed_commands: list[str] = Field(default_factory=list)
+    """Commands the ShellConnector may execute (empty = use default set)."""
+    connector_audit_log: str = ""
+    """Path for connector audit log (default: ~/.isaac/connector_audit.log)."""
+
+    # Connector env-vars (optional — loaded from environment)
+    github_token: str = ""
+    email_imap_host: str = ""
+    email_user: str = ""
+    email_password: str = ""
+    email_imap_port: int = 993
+    obsidian_vault_path: str = ""
+
+    # Email — SMTP (outbound)
+    email_smtp_host: str = ""
+    email_smtp_port: int = 587
+    email_smtp_user: str = ""
+    email_smtp_password: str = ""
+
+    # CalDAV
+    caldav_url: str = ""
+    caldav_username: str = ""
+    caldav_password: str = ""
+
+    # ── Background / Cron ───────────────────────────────────────────────
+    cron_poll_seconds: int = Field(default=30, ge=5, le=600)
+    """Seconds between cron daemon poll cycles."""
+    cron_enabled: bool = False
+    """Whether to auto-start the cron daemon on boot."""
+
@@ -33,37 +33,11 @@ from __future__ import annotations
 
 import logging
 import sys
-from typing import Any
-
-from langchain_core.messages import AIMessage, HumanMessage
-from langgraph.graph import END, StateGraph
-
-from isaac.core.state import IsaacState, make_initial_state
-from isaac.core.transitions import (
-    NODE_COMPUTER_USE,
-    NODE_DIRECT_RESPONSE,
-    NODE_EXPLORER,
-    NODE_PERCEPTION,
-    NODE_SANDBOX,
-    after_guard,
-    after_perception,
-    after_reflection,
-    after_skill_abstraction,
-    after_synthesis,
-)
-from isaac.nodes.approval import await_approval_node
-from isaac.nodes.computer_use import computer_use_node, shutdown_ui_executor
-from isaac.nodes.connector_execution import connector_execution_node
-from isaac.nodes.direct_response import direct_response_node
-from isaac.nodes.explorer import explorer_node
-from isaac.nodes.guard import guard_node
-from isaac.nodes.perception import perception_node
-from isaac.nodes.planner import planner_node
-from isaac.nodes.reflection import reflection_node
-from isaac.nodes.sandbox import sandbox_node
-from isaac.nodes.skill_abstraction import skill_abstraction_node
-from isaac.nodes.synthesis import synthesis_node
-from isaac.memory.context_manager import compress_messages
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
 
 logger = logging.getLogger(__name__)
 
@@ -84,17 +58,38 @@ _CONNECTOR_EXEC = "connector_execution"
 _DIRECT_RESPONSE = "direct_response"
 _AWAIT_APPROVAL = "await_approval"
 
+# Progress-line labels, formatted once rather than on every streamed event
+_PHASE_LABELS: dict[str, str] = {
+    p: p.replace("_", " ").title()
+    for p in (
+        _GUARD,
+        _PERCEPTION,
+        _EXPLORER,
+        _PLANNER,
+        _SYNTHESIS,
+        _SANDBOX,
+        _COMPUTER_USE,
+        _REFLECTION,
+        _SKILL_ABSTRACTION,
+        _CONNECTOR_EXEC,
+        _DIRECT_RESPONSE,
+        _AWAIT_APPROVAL,
+    )
+}
+
 
 # ---------------------------------------------------------------------------
 # Graph builder
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1)
 def build_graph() -> Any:
     """Construct and compile the I.S.A.A.C. cognitive graph.
 
     Returns a compiled ``StateGraph`` ready for ``.invoke()`` or
-    ``.stream()``.
+    ``.stream()``.  The compiled graph is immutable, so it is built once per
+    process and shared by every caller.
 
     Full topology::
 
@@ -117,6 +112,36 @@ def build_graph() -> Any:
        ▼ pending         ▼ complete
      Planner             END
     """
+    # Node modules pull in the LLM clients, Docker and the UI executor, so
+    # they are only imported once a graph is actually needed.
+    from langgraph.graph import END, StateGraph
+
+    from isaac.core.state import IsaacState
+    from isaac.core.transitions import (
+        NODE_COMPUTER_USE,
+        NODE_DIRECT_RESPONSE,
+        NODE_EXPLORER,
+        NODE_PERCEPTION,
+        NODE_SANDBOX,
+        after_guard,
+        after_perception,
+        after_reflection,
+        after_skill_abstraction,
+        after_synthesis,
+    )
+    from isaac.nodes.approval import await_approval_node
+    from isaac.nodes.computer_use import computer_use_node
+    from isaac.nodes.connector_execution import connector_execution_node
+    from isaac.nodes.direct_response import direct_response_node
+    from isaac.nodes.explorer import explorer_node
+    from isaac.nodes.guard import guard_node
+    from isaac.nodes.perception import perception_node
+    from isaac.nodes.planner import planner_node
+    from isaac.nodes.reflection import reflection_node
+    from isaac.nodes.sandbox import sandbox_node
+    from isaac.nodes.skill_abstraction import skill_abstraction_node
+    from isaac.nodes.synthesis import synthesis_node
+
     graph = StateGraph(IsaacState)
 
     # Wrap each node with the telemetry decorator so per-node duration /
@@ -204,6 +229,21 @@ def build_graph() -> Any:
     return graph.compile()
 
 
+def build_graph_in_background() -> Future[Any]:
+    """Start :func:`build_graph` on a worker thread and return its future.
+
+    Interactive front-ends call this before their first prompt so the node
+    and LangGraph imports overlap with the user typing; the first turn waits
+    on the future only if compilation hasn't finished yet.
+    """
+    import concurrent.futures
+
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="isaac-graph")
+    future = pool.submit(build_graph)
+    pool.shutdown(wait=False)
+    return future
+
+
 # ---------------------------------------------------------------------------
 # Interactive runner
 # ---------------------------------------------------------------------------
@@ -220,20 +260,23 @@ def build_and_run() -> int:
     int
         Exit code (0 = normal exit).
     """
+    from langchain_core.messages import AIMessage, HumanMessage
+
+    from isaac.core.state import make_initial_state
+    from isaac.memory.context_manager import compress_messages
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s  %(name)-30s  %(levelname)-7s  %(message)s",
     )
 
-    # Force UTF-8 on Windows so Unicode characters work in the terminal
+    # Force UTF-8 on Windows so Unicode characters work in the terminal.
+    # Reconfigured in place so repeated calls don't stack new wrappers.
     if sys.platform == "win32":
         import io
-        sys.stdout = io.TextIOWrapper(
-            sys.stdout.buffer, encoding="utf-8", errors="replace", line_buffering=True,
-        )
-        sys.stderr = io.TextIOWrapper(
-            sys.stderr.buffer, encoding="utf-8", errors="replace", line_buffering=True,
-        )
+        for stream in (sys.stdout, sys.stderr):
+            if isinstance(stream, io.TextIOWrapper):
+                stream.reconfigure(encoding="utf-8", errors="replace", line_buffering=True)
 
     # Register tools and start background services
     try:
@@ -259,7 +302,10 @@ def build_and_run() -> int:
         pass
 
     import uuid
-    compiled = build_graph()
+
+    # Compile the graph while the user types the first prompt
+    graph_future = build_graph_in_background()
+
     state = make_initial_state()
     state["session_id"] = str(uuid.uuid4())
 
@@ -285,11 +331,9 @@ def build_and_run() -> int:
             except Exception:
                 pass
 
-            # Append the user message
-            state["messages"] = [HumanMessage(content=user_input)]
-
-            # Compress history if it's grown too large
-            state["messages"] = compress_messages(state.get("messages", []))
+            # Append the user message, compressing history if it's grown too
+            # large before it is bound into the state
+            state["messages"] = compress_messages([HumanMessage(content=user_input)])
 
             # Run the graph with streaming progress
             try:
@@ -297,7 +341,10 @@ def build_and_run() -> int:
                 seen_phases: set[str] = set()
                 is_direct = False
 
-                for event in compiled.stream(dict(state)):
+                # LangGraph never mutates its input, so the state is passed
+                # as-is rather than copied every turn.
+                compiled = graph_future.result()
+                for event in compiled.stream(state):
                     # event is {node_name: state_update}
                     for node_name, node_output in event.items():
                         if isinstance(node_output, dict):
@@ -310,28 +357,32 @@ def build_and_run() -> int:
                             # Show progress for non-direct paths
                             if not is_direct and phase and phase not in seen_phases:
                                 seen_phases.add(phase)
-                                _phase_label = phase.replace("_", " ").title()
+                                _phase_label = _PHASE_LABELS.get(phase) or (
+                                    phase.replace("_", " ").title()
+                                )
                                 sys.stdout.write(
                                     f"\r  > {_phase_label}..."
                                     f"{'': <40}"
                                 )
                                 sys.stdout.flush()
 
+                            # Print replies as soon as the node that wrote
+                            # them finishes instead of after the whole graph.
+                            # DirectResponse already streams to stdout — skip
+                            # reprinting.
+                            if not is_direct:
+                                for msg in node_output.get("messages", []):
+                                    if isinstance(msg, AIMessage):
+                                        sys.stdout.write("\r" + " " * 60 + "\r")
+                                        print(f"\n\033[1;36m[I.S.A.A.C.]\033[0m {msg.content}\n")
+
                 if not is_direct and seen_phases:
                     sys.stdout.write("\r" + " " * 60 + "\r")
                     sys.stdout.flush()
 
-                # Merge result back into state
+                # Merge back only the keys the nodes actually produced
                 state.update(result)  # type: ignore[arg-type]
 
-                # Print final response
-                msgs = result.get("messages", [])
-                # DirectResponse already streams to stdout — skip reprinting
-                if not is_direct:
-                    for msg in msgs:
-                        if isinstance(msg, AIMessage):
-                            print(f"\n\033[1;36m[I.S.A.A.C.]\033[0m {msg.content}\n")
-
                 # Print execution summary
                 logs = result.get("execution_logs", [])
                 if logs:
@@ -363,8 +414,11 @@ def build_and_run() -> int:
     except KeyboardInterrupt:
         print("\nShutting down.")
     finally:
-        # Tear down the UI container if one was started
-        shutdown_ui_executor()
+        # Tear down the UI container if one was started; a session that never
+        # loaded the ComputerUse node has nothing to stop.
+        computer_use = sys.modules.get("isaac.nodes.computer_use")
+        if computer_use is not None:
+            computer_use.shutdown_ui_executor()
         # Stop background scheduler
         try:
             stop_scheduler()
@@ -22,21 +22,21 @@ from langgraph.graph.message import add_messages
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreenElement:
     """A UI element detected on screen via OCR or accessibility tree."""
 
     label: str
     role: str
     """Semantic role: 'button', 'input', 'link', 'text', 'image', 'checkbox'."""
-    bbox: tuple[int, int, int, int] = field(default_factory=lambda: (0, 0, 0, 0))
+    bbox: tuple[int, int, int, int] = (0, 0, 0, 0)
     """Bounding box (x1, y1, x2, y2) in absolute screen pixels."""
     text: str = ""
     is_focused: bool = False
     confidence: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class GUIState:
     """Snapshot of the graphical desktop state inside the VNC sandbox."""
 
@@ -57,7 +57,7 @@ class GUIState:
     display: str = ":99"
 
 
-@dataclass
+@dataclass(slots=True)
 class UIAction:
     """A single atomic UI interaction the agent wants to perform."""
 
@@ -85,7 +85,7 @@ class UIAction:
     description: str = ""        # human-readable intent; used by SkillAbstraction
 
 
-@dataclass
+@dataclass(slots=True)
 class UIActionResult:
     """Outcome of executing a single UIAction inside the VNC sandbox."""
 
@@ -102,7 +102,7 @@ class UIActionResult:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldModel:
     """Structured representation of the current environment state."""
 
@@ -124,7 +124,7 @@ class WorldModel:
     """Last navigated URL (populated by computer_use node)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanStep:
     """A single step in the agent's dynamic plan (Graph-of-Thought)."""
 
@@ -136,7 +136,7 @@ class PlanStep:
     depends_on: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Raw output captured from a single Docker sandbox run."""
 
@@ -146,7 +146,7 @@ class ExecutionResult:
     duration_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillCandidate:
     """A code pattern being evaluated for promotion to the Skill Library."""
 
@@ -162,7 +162,7 @@ class SkillCandidate:
     """Semantic tags for retrieval (e.g. ['ui', 'playwright', 'login'])."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEntry:
     """A single failure record for the self-reflection stack."""
 
@@ -204,7 +204,15 @@ class PendingApproval:
 
 
 def _append_list(left: list[Any], right: list[Any]) -> list[Any]:
-    """Reducer that appends new items to an existing list."""
+    """Reducer that appends new items to an existing list.
+
+    Never extends *left* in place: LangGraph seeds the channel with the
+    caller's input list by reference, so mutating it would leak into the
+    REPL's own state.  Empty updates (Perception returns
+    ``ui_actions=[]`` on every turn) skip the copy.
+    """
+    if not right:
+        return left
     return left + right
 
 
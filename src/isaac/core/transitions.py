@@ -28,14 +28,12 @@ NODE_PERCEPTION = "perception"
 END = "__end__"
 
 
-def _count_reflection_errors(state: IsaacState) -> int:
-    """Total number of errors recorded by the Reflection node."""
-    return len([e for e in state.get("errors", []) if e.node == "reflection"])
+_RETRY_ERROR_NODES = frozenset({"reflection", "computer_use"})
 
 
-def _count_computer_use_errors(state: IsaacState) -> int:
-    """Total number of errors recorded by the ComputerUse node."""
-    return len([e for e in state.get("errors", []) if e.node == "computer_use"])
+def _count_retry_errors(state: IsaacState) -> int:
+    """Errors recorded by the Reflection and ComputerUse nodes, in one pass."""
+    return sum(1 for e in state.get("errors", []) if e.node in _RETRY_ERROR_NODES)
 
 
 def _has_pending_steps(plan: list[PlanStep]) -> bool:
@@ -135,7 +133,7 @@ def after_reflection(state: IsaacState) -> str:
         logger.info("Transition: Reflection → Skill Abstraction (success).")
         return NODE_SKILL_ABSTRACTION
 
-    n_errors = _count_reflection_errors(state) + _count_computer_use_errors(state)
+    n_errors = _count_retry_errors(state)
     if n_errors >= max_retries:
         logger.warning(
             "Transition: %d errors >= max_retries (%d) — terminating.",
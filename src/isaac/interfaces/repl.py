@@ -22,7 +22,7 @@ from typing import Any
 
 from langchain_core.messages import AIMessage, HumanMessage
 
-from isaac.core.graph import build_graph
+from isaac.core.graph import build_graph_in_background
 from isaac.core.state import IsaacState, make_initial_state
 from isaac.interfaces.terminal_ui import TerminalUI
 from isaac.memory.context_manager import compress_messages
@@ -184,16 +184,13 @@ def run_repl() -> int:
     for noisy in ("httpx", "apscheduler", "chromadb", "isaac"):
         logging.getLogger(noisy).setLevel(logging.WARNING)
 
-    # Force UTF-8 on Windows
+    # Force UTF-8 on Windows (in place, so re-entry doesn't stack wrappers)
     if sys.platform == "win32":
         import io as _io
         try:
-            sys.stdout = _io.TextIOWrapper(
-                sys.stdout.buffer, encoding="utf-8", errors="replace", line_buffering=True,
-            )
-            sys.stderr = _io.TextIOWrapper(
-                sys.stderr.buffer, encoding="utf-8", errors="replace", line_buffering=True,
-            )
+            for stream in (sys.stdout, sys.stderr):
+                if isinstance(stream, _io.TextIOWrapper):
+                    stream.reconfigure(encoding="utf-8", errors="replace", line_buffering=True)
         except Exception:
             pass
 
@@ -223,7 +220,8 @@ def run_repl() -> int:
         pass
 
     # -- Build graph & state -----------------------------------------------
-    compiled = build_graph()
+    # Compile the graph while the user types the first prompt
+    graph_future = build_graph_in_background()
     state: dict[str, Any] = dict(make_initial_state())
 
     # -- Background model pre-warm (load weights into VRAM before first query)
@@ -274,8 +272,7 @@ def run_repl() -> int:
                 pass
 
             # -- Append user message ----------------------------------------
-            state["messages"] = [HumanMessage(content=user_input)]
-            state["messages"] = compress_messages(state.get("messages", []))
+            state["messages"] = compress_messages([HumanMessage(content=user_input)])
 
             ui.start_thinking()
 
@@ -285,7 +282,9 @@ def run_repl() -> int:
                 seen_phases: set[str] = set()
                 is_direct = False
 
-                for event in compiled.stream(dict(state)):
+                # LangGraph never mutates its input, so the state is passed as-is.
+                compiled = graph_future.result()
+                for event in compiled.stream(state):
                     for node_name, node_output in event.items():
                         if isinstance(node_output, dict):
                             result.update(node_output)
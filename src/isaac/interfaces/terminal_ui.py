@@ -140,7 +140,8 @@ class TerminalUI:
 
     def print_phase(self, phase: str) -> None:
         """Print a phase-transition indicator."""
-        icon, label = PHASE_ICONS.get(phase, ("\u2022", phase.replace("_", " ").title()))
+        entry = PHASE_ICONS.get(phase)
+        icon, label = entry or ("\u2022", phase.replace("_", " ").title())
         self.console.print(f"  [isaac.dim]{icon}[/isaac.dim]  [isaac.node]{label}[/isaac.node]")
 
     def print_thinking(self) -> None:
@@ -26,7 +26,7 @@ from typing import Any
 
 from langchain_core.messages import AIMessage, HumanMessage
 
-from isaac.core.graph import build_graph
+from isaac.core.graph import build_graph_in_background
 from isaac.core.state import make_initial_state
 from isaac.memory.context_manager import compress_messages
 
@@ -126,7 +126,8 @@ def run_voice_repl(hands_free: bool = False) -> int:
     except Exception:
         pass
 
-    compiled = build_graph()
+    # Compile the graph while the first utterance is being captured
+    graph_future = build_graph_in_background()
     state: dict[str, Any] = dict(make_initial_state())
     state["session_id"] = str(uuid.uuid4())
 
@@ -194,13 +195,14 @@ def run_voice_repl(hands_free: bool = False) -> int:
             except Exception:
                 pass
 
-            state["messages"] = [HumanMessage(content=user_text)]
-            state["messages"] = compress_messages(state.get("messages", []))
+            state["messages"] = compress_messages([HumanMessage(content=user_text)])
 
             # Run the cognitive graph
             try:
                 result: dict[str, Any] = {}
-                for event in compiled.stream(dict(state)):
+                # LangGraph never mutates its input, so the state is passed as-is.
+                compiled = graph_future.result()
+                for event in compiled.stream(state):
                     for _node, node_output in event.items():
                         if isinstance(node_output, dict):
                             result.update(node_output)
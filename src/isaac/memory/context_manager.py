@@ -16,6 +16,7 @@ from langchain_core.messages import (
     BaseMessage,
     HumanMessage,
     SystemMessage,
+    ToolMessage,
 )
 
 logger = logging.getLogger(__name__)
@@ -110,7 +111,9 @@ def compress_messages(
 
     Strategy:
     1. If ``len(messages) <= max_messages``, return unchanged.
-    2. Otherwise, split into ``old_messages`` and ``recent_messages``.
+    2. Otherwise, split into ``old_messages`` and ``recent_messages``,
+       moving the split back so tool results stay with the ``AIMessage``
+       that requested them.
     3. Summarise the old messages into a single ``SystemMessage``.
     4. Return ``[summary] + recent_messages``.
 
@@ -146,8 +149,14 @@ def compress_messages(
     if len(non_system) <= keep_recent:
         return messages
 
-    old = non_system[:-keep_recent]
-    recent = non_system[-keep_recent:]
+    split = len(non_system) - keep_recent
+    while split > 0 and isinstance(non_system[split], ToolMessage):
+        split -= 1
+    if split == 0:
+        return messages
+
+    old = non_system[:split]
+    recent = non_system[split:]
 
     summary_text = summarise_messages(old, llm)
     summary_msg = SystemMessage(
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import json
 import logging
+from dataclasses import replace
 from typing import Any
 
 from isaac.core.state import (
@@ -131,12 +132,14 @@ def computer_use_node(state: IsaacState) -> dict[str, Any]:
     new_results: list[UIActionResult] = []
     step_done = False
     done_summary = ""
+    gui_state: GUIState | None = None
 
     while current_ui_cycle < max_cycles:
         current_ui_cycle += 1
 
-        # Capture current state
-        gui_state: GUIState = executor.get_gui_state()
+        # Capture current state (later cycles reuse the last after-shot)
+        if gui_state is None:
+            gui_state = executor.get_gui_state()
         screenshot_b64 = gui_state.screenshot_b64
 
         if not screenshot_b64:
@@ -173,11 +176,15 @@ def computer_use_node(state: IsaacState) -> dict[str, Any]:
         result = executor.act(action)
         new_results.append(result)
 
-        # Refresh GUI state in world model
-        updated_gui = executor.get_gui_state()
-        world_model.gui_state = updated_gui
-        if updated_gui.current_url:
-            world_model.last_url = updated_gui.current_url
+        # Refresh GUI state in world model.  The action already captured the
+        # display after it ran, so only re-capture if that screenshot failed.
+        if result.screenshot_after_b64:
+            gui_state = replace(gui_state, screenshot_b64=result.screenshot_after_b64)
+        else:
+            gui_state = executor.get_gui_state()
+        world_model.gui_state = gui_state
+        if gui_state.current_url:
+            world_model.last_url = gui_state.current_url
 
         logger.debug(
             "ComputerUse: cycle %d — action=%s success=%s",
@@ -10,12 +10,26 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from isaac.core.state import IsaacState
+from isaac.core.state import ExecutionResult, IsaacState
 from isaac.sandbox.executor import CodeExecutor
 
 logger = logging.getLogger(__name__)
 
 
+def _share_repeated_output(result: ExecutionResult, logs: list[ExecutionResult]) -> None:
+    """Point *result*'s stdout/stderr at an identical string already in *logs*.
+
+    Retry loops often fail with the same traceback every time; reusing the
+    existing string keeps ``execution_logs`` from holding one copy per run.
+    """
+    seen: dict[str, str] = {}
+    for prev in logs:
+        seen.setdefault(prev.stdout, prev.stdout)
+        seen.setdefault(prev.stderr, prev.stderr)
+    result.stdout = seen.get(result.stdout, result.stdout)
+    result.stderr = seen.get(result.stderr, result.stderr)
+
+
 def sandbox_node(state: IsaacState) -> dict[str, Any]:
     """LangGraph node: Sandbox.
 
@@ -26,8 +40,6 @@ def sandbox_node(state: IsaacState) -> dict[str, Any]:
     code = state.get("code_buffer", "")
     if not code.strip():
         logger.warning("Sandbox: empty code_buffer — skipping execution.")
-        from isaac.core.state import ExecutionResult
-
         return {
             "execution_logs": [
                 ExecutionResult(
@@ -46,6 +58,8 @@ def sandbox_node(state: IsaacState) -> dict[str, Any]:
     finally:
         executor.close()
 
+    _share_repeated_output(result, state.get("execution_logs", []))
+
     logger.info(
         "Sandbox: exit_code=%d  stdout=%d chars  stderr=%d chars",
         result.exit_code,
@@ -17,11 +17,15 @@ Categories
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
 import logging
+import mmap
+import os
 import threading
 from datetime import datetime, timezone
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
@@ -33,6 +37,30 @@ AuditCategory = Literal[
 
 _GENESIS_HASH = "0" * 64
 
+@lru_cache(maxsize=1)
+def load_orjson() -> Any | None:
+    """Return the ``orjson`` module if installed (``isaac[speedups]`` extra), else ``None``."""
+    try:
+        import orjson  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return orjson
+
+
+def _parse_line(line: bytes | str) -> dict[str, Any]:
+    """Decode one JSONL row, preferring orjson when it is available."""
+    orjson = load_orjson()
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN, which the stdlib writer emits but orjson rejects
+    return json.loads(line)
+
+
+# Below this size a parallel verify costs more in process start-up than it saves.
+_PARALLEL_MIN_BYTES = 1 << 20
+
 
 @dataclass
 class AuditEntry:
@@ -48,8 +76,19 @@ class AuditEntry:
 
     def compute_hash(self) -> str:
         """Compute SHA-256 over (prev_hash + timestamp + category + action + details)."""
-        payload = f"{self.prev_hash}|{self.timestamp}|{self.category}|{self.action}|{json.dumps(self.details, sort_keys=True)}"
-        return hashlib.sha256(payload.encode()).hexdigest()
+        return _chain_hash(
+            self.prev_hash, self.timestamp, self.category, self.action, self.details,
+        )
+
+
+def _chain_hash(
+    prev_hash: str, timestamp: str, category: str, action: str, details: dict[str, Any],
+) -> str:
+    """Hash one entry's fields; shared by :meth:`AuditEntry.compute_hash` and verification."""
+    # Most entries carry no details — skip json.dumps for them.
+    details_json = json.dumps(details, sort_keys=True) if details else "{}"
+    payload = f"{prev_hash}|{timestamp}|{category}|{action}|{details_json}"
+    return hashlib.sha256(payload.encode()).hexdigest()
 
 
 class AuditLog:
@@ -127,7 +166,7 @@ class AuditLog:
 
             try:
                 with open(self._log_path, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+                    f.write(json.dumps(vars(entry), ensure_ascii=False) + "\n")
             except Exception as exc:
                 logger.error("Failed to write audit entry: %s", exc)
 
@@ -145,45 +184,160 @@ class AuditLog:
         if not self._log_path.exists():
             return True, 0
 
+        try:
+            with open(self._log_path, "rb") as f:
+                return self._verify_lines(f, _GENESIS_HASH)
+        except OSError as exc:
+            logger.error("Audit chain verification failed: %s", exc)
+            return False, 0
+
+    def verify_chain_tail(self, n: int) -> tuple[bool, int]:
+        """Verify only the last *n* entries.
+
+        The walk starts from the ``prev_hash`` stored in the first of those
+        entries, so it proves the tail is internally consistent without
+        re-hashing the whole log.  Use :meth:`verify_chain` to prove the
+        tail is anchored to the genesis hash.
+        """
+        try:
+            lines = self._tail_lines(n)
+            if not lines:
+                return True, 0
+            start = _parse_line(lines[0]).get("prev_hash", "")
+            return self._verify_lines(lines, start)
+        except Exception as exc:
+            logger.error("Audit chain verification failed: %s", exc)
+            return False, 0
+
+    def verify_chain_parallel(self, workers: int | None = None) -> tuple[bool, int]:
+        """Verify the entire log using *workers* processes.
+
+        Every entry stores its own ``prev_hash``, so each byte range of the
+        file can be re-hashed independently.  The coordinator then only has
+        to check that consecutive ranges link up.  Results match
+        :meth:`verify_chain`.
+        """
+        if not self._log_path.exists():
+            return True, 0
+        workers = workers or os.cpu_count() or 1
+        try:
+            size = self._log_path.stat().st_size
+            if workers < 2 or size < _PARALLEL_MIN_BYTES:
+                return self.verify_chain()
+            ranges = self._split_ranges(size, workers)
+        except OSError as exc:
+            logger.error("Audit chain verification failed: %s", exc)
+            return False, 0
+
+        import concurrent.futures
+
+        path = str(self._log_path)
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(
+                    _verify_range,
+                    [path] * len(ranges),
+                    [start for start, _ in ranges],
+                    [end for _, end in ranges],
+                ))
+        except Exception as exc:
+            logger.error("Audit chain verification failed: %s", exc)
+            return False, 0
+
         prev = _GENESIS_HASH
+        total = 0
+        for valid, count, first_prev, last_hash in results:
+            if count == 0 and valid:
+                continue
+            # An empty first_prev means the range's first line didn't parse;
+            # the count check below reports it at the right entry.
+            if first_prev and first_prev != prev:
+                logger.error(
+                    "Audit chain broken at entry %d: expected prev=%s, got prev=%s.",
+                    total,
+                    prev[:16],
+                    first_prev[:16],
+                )
+                return False, total
+            total += count
+            if not valid:
+                return False, total
+            prev = last_hash
+        return True, total
+
+    def _split_ranges(self, size: int, parts: int) -> list[tuple[int, int]]:
+        """Cut the log into *parts* byte ranges that end on line boundaries."""
+        with open(self._log_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            bounds = [0]
+            for i in range(1, parts):
+                cut = mm.find(b"\n", max(size * i // parts, bounds[-1]))
+                if cut < 0:
+                    break
+                bounds.append(cut + 1)
+        bounds.append(size)
+        return [(a, b) for a, b in itertools.pairwise(bounds) if b > a]
+
+    @staticmethod
+    def _verify_lines(lines: Any, prev: str) -> tuple[bool, int]:
+        """Walk raw JSONL *lines*, checking links and hashes from *prev*."""
         count = 0
-
         try:
-            with open(self._log_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    data = json.loads(line)
-                    entry = AuditEntry(**data)
-
-                    if entry.prev_hash != prev:
-                        logger.error(
-                            "Audit chain broken at entry %d: expected prev=%s, got prev=%s.",
-                            count,
-                            prev[:16],
-                            entry.prev_hash[:16],
-                        )
-                        return False, count
-
-                    recomputed = entry.compute_hash()
-                    if recomputed != entry.entry_hash:
-                        logger.error(
-                            "Audit hash mismatch at entry %d: expected %s, got %s.",
-                            count,
-                            recomputed[:16],
-                            entry.entry_hash[:16],
-                        )
-                        return False, count
-
-                    prev = entry.entry_hash
-                    count += 1
+            for line in lines:
+                if not line.strip():
+                    continue
+                data = _parse_line(line)
+
+                if data["prev_hash"] != prev:
+                    logger.error(
+                        "Audit chain broken at entry %d: expected prev=%s, got prev=%s.",
+                        count,
+                        prev[:16],
+                        data["prev_hash"][:16],
+                    )
+                    return False, count
+
+                recomputed = _chain_hash(
+                    prev,
+                    data["timestamp"],
+                    data["category"],
+                    data["action"],
+                    data.get("details") or {},
+                )
+                if recomputed != data["entry_hash"]:
+                    logger.error(
+                        "Audit hash mismatch at entry %d: expected %s, got %s.",
+                        count,
+                        recomputed[:16],
+                        data["entry_hash"][:16],
+                    )
+                    return False, count
+
+                prev = data["entry_hash"]
+                count += 1
 
             return True, count
         except Exception as exc:
             logger.error("Audit chain verification failed: %s", exc)
             return False, count
 
+    def _tail_lines(self, n: int) -> list[bytes]:
+        """Return the last *n* non-empty lines, scanning backwards from EOF."""
+        if n <= 0 or not self._log_path.exists() or self._log_path.stat().st_size == 0:
+            return []
+        with open(self._log_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            lines: list[bytes] = []
+            while end > 0 and len(lines) < n:
+                start = mm.rfind(b"\n", 0, end - 1) + 1
+                line = mm[start:end].strip()
+                if line:
+                    lines.append(line)
+                end = start
+        lines.reverse()
+        return lines
+
     def recent(self, n: int = 20) -> list[AuditEntry]:
         """Return the last *n* entries."""
         if not self._log_path.exists():
@@ -191,17 +345,36 @@ class AuditLog:
 
         entries: list[AuditEntry] = []
         try:
-            with open(self._log_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-            for line in lines[-n:]:
-                line = line.strip()
-                if line:
-                    entries.append(AuditEntry(**json.loads(line)))
+            for line in self._tail_lines(n):
+                entries.append(AuditEntry(**_parse_line(line)))
         except Exception as exc:
             logger.debug("Failed to read recent audit entries: %s", exc)
         return entries
 
 
+def _verify_range(path: str, start: int, end: int) -> tuple[bool, int, str, str]:
+    """Verify the lines in ``[start, end)`` of *path* (process-pool worker).
+
+    Returns ``(valid, count, first_prev_hash, last_entry_hash)`` so the
+    caller can check that neighbouring ranges link up.  A first line that
+    cannot be parsed yields ``(False, 0, "", "")``.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        lines = f.read(end - start).splitlines()
+    lines = [line for line in lines if line.strip()]
+    if not lines:
+        return True, 0, "", ""
+    try:
+        first_prev = _parse_line(lines[0])["prev_hash"]
+    except (ValueError, TypeError, KeyError) as exc:
+        logger.error("Audit chain verification failed: %s", exc)
+        return False, 0, "", ""
+    valid, count = AuditLog._verify_lines(lines, first_prev)
+    last_hash = _parse_line(lines[count - 1])["entry_hash"] if count else first_prev
+    return valid, count, first_prev, last_hash
+
+
 # ---------------------------------------------------------------------------
 # Singleton
 # ---------------------------------------------------------------------------
@@ -6,6 +6,8 @@ global :class:`ToolRegistry`.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from isaac.tools.base import ToolRegistry, get_tool_registry
 from isaac.tools.browser import BrowserTool
 from isaac.tools.file import FileReadTool, FileWriteTool, FileListTool, FileDeleteTool
@@ -15,8 +17,14 @@ from isaac.tools.calendar import CalendarReadTool, CalendarWriteTool
 from isaac.tools.code import CodeTool
 
 
+@lru_cache(maxsize=1)
 def register_all_tools() -> ToolRegistry:
-    """Instantiate and register every built-in tool."""
+    """Instantiate and register every built-in tool.
+
+    Registration happens once per process; later calls (e.g. ``isaac run
+    --classic`` reaching :func:`~isaac.core.graph.build_and_run`) return the
+    already-populated registry.
+    """
     registry = get_tool_registry()
     for tool_cls in (
         BrowserTool,
@@ -5,6 +5,8 @@ from __future__ import annotations
 import numpy as np
 
 from isaac.arc.dsl import (
+    BATCH_PRIMITIVES,
+    OUTPUT_SHAPES,
     PRIMITIVES,
     apply_program,
     compose,
@@ -128,6 +130,18 @@ class TestColourOps:
         expected = np.array([[9, 0], [4, 6]])
         assert np.array_equal(invert_colours(grid), expected)
 
+    def test_fill_colour_uint8_lut(self) -> None:
+        grid = np.array([[1, 0, 1], [0, 2, 0]], dtype=np.uint8)
+        result = fill_colour(grid, from_colour=1, to_colour=3)
+        assert result.dtype == np.uint8
+        assert result.tolist() == [[3, 0, 3], [0, 2, 0]]
+        result[0, 0] = 9  # gathered output must be writable
+        assert grid[0, 0] == 1
+
+    def test_invert_colours_uint8_does_not_wrap(self) -> None:
+        grid = np.array([[0, 9, 12]], dtype=np.uint8)
+        assert invert_colours(grid).tolist() == [[9, 0, -3]]
+
 
 class TestGridManipulation:
     def test_crop_to_object(self) -> None:
@@ -197,6 +211,15 @@ class TestFloodFill:
         assert result[1, 1] == 5
         assert result[2, 2] == 1  # different region unchanged
 
+    def test_label_and_bytearray_paths_agree(self, monkeypatch) -> None:
+        import isaac.arc.dsl as dsl
+
+        rng = np.random.default_rng(0)
+        grid = rng.integers(0, 3, size=(12, 12))
+        labelled = flood_fill_from(grid, row=5, col=5, colour=7)
+        monkeypatch.setattr(dsl, "_LABEL_MIN_CELLS", grid.size + 1)
+        assert np.array_equal(flood_fill_from(grid, row=5, col=5, colour=7), labelled)
+
     def test_flood_fill_same_colour_noop(self) -> None:
         grid = np.array([[1, 1], [1, 1]])
         result = flood_fill_from(grid, row=0, col=0, colour=1)
@@ -231,6 +254,24 @@ class TestApplyProgram:
         assert result[0, 0] == 5
         assert result[0, 1] == 0
 
+    def test_unexpected_args_dropped(self) -> None:
+        grid = np.array([[1, 2], [3, 4]])
+        program = [{"op": "rotate_90", "args": {"colour": 3}}]
+        result = apply_program(program, grid)
+        assert np.array_equal(result, rotate_90(grid))
+
+    def test_missing_required_args_skipped(self) -> None:
+        grid = np.array([[1, 2], [3, 4]])
+        program = [{"op": "fill_colour", "args": {"from_colour": 1}}, {"op": "rotate_180"}]
+        result = apply_program(program, grid)
+        assert np.array_equal(result, rotate_180(grid))
+
+    def test_empty_program_returns_copy(self) -> None:
+        grid = np.array([[1, 2]])
+        result = apply_program([], grid)
+        assert np.array_equal(result, grid)
+        assert result is not grid
+
     def test_unknown_op_skipped(self) -> None:
         grid = np.array([[1, 2]])
         program = [{"op": "nonexistent_op"}, {"op": "rotate_180"}]
@@ -253,3 +294,34 @@ class TestPrimitivesRegistry:
         assert core.issubset(registered), f"Missing core primitives: {core - registered}"
         # Extended DSL must have at least 50 primitives total
         assert len(registered) >= 50, f"Expected >= 50 primitives, got {len(registered)}"
+
+    def test_outputs_never_alias_input(self) -> None:
+        grid = np.array([[1, 0, 2], [0, 3, 0], [4, 0, 5]])
+        for name, fn in PRIMITIVES.items():
+            try:
+                result = fn(grid)
+            except TypeError:
+                continue  # primitive needs extra positional args
+            assert not np.shares_memory(result, grid), f"{name} aliases its input"
+
+
+class TestBatchPrimitives:
+    def test_match_per_grid_primitives(self) -> None:
+        stack = np.arange(2 * 3 * 4).reshape(2, 3, 4) % 10
+        for name, batch_fn in BATCH_PRIMITIVES.items():
+            batched = batch_fn(stack)
+            for grid, out in zip(stack, batched):
+                assert np.array_equal(out, PRIMITIVES[name](grid)), name
+
+
+class TestOutputShapes:
+    def test_rules_match_actual_shapes(self) -> None:
+        rng = np.random.default_rng(0)
+        for name, rule in OUTPUT_SHAPES.items():
+            for shape in [(1, 1), (2, 3), (4, 4), (5, 2), (7, 9)]:
+                grid = rng.integers(0, 3, size=shape).astype(np.uint8)
+                try:
+                    out = PRIMITIVES[name](grid)
+                except Exception:
+                    continue
+                assert out.shape == rule(shape), (name, shape)
@@ -6,16 +6,18 @@ import json
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 from isaac.arc.evaluator import (
     ArcPair,
     ArcTask,
     EvalReport,
-    TaskResult,
+    _run_llm_solve,
     build_arc_prompt,
     evaluate,
     load_tasks,
     solve_with_dsl,
+    solve_with_llm,
 )
 
 
@@ -68,6 +70,7 @@ class TestTaskLoading:
         assert len(tasks[0].train) == 1
         assert len(tasks[0].test) == 1
         assert np.array_equal(tasks[0].train[0].input, np.array([[0, 1], [2, 3]]))
+        assert tasks[0].train[0].input.dtype == np.uint8
 
     def test_load_single_object(self, tmp_path: Path) -> None:
         """Test loading a single task object (not wrapped in a list)."""
@@ -84,6 +87,21 @@ class TestTaskLoading:
         assert tasks[0].id == "solo"
 
 
+class TestArcTaskLayout:
+    def test_uniform_shapes_are_stacked(self) -> None:
+        a, b = np.array([[1, 2]]), np.array([[3, 4]])
+        task = ArcTask(id="t", train=[ArcPair(a, b), ArcPair(b, a)], test=[])
+        assert task.train_inputs[1] is b
+        assert task.train_outputs_stacked is not None
+        assert task.train_outputs_stacked.shape == (2, 1, 2)
+
+    def test_ragged_shapes_not_stacked(self) -> None:
+        a, b = np.array([[1, 2]]), np.array([[3], [4]])
+        task = ArcTask(id="t", train=[ArcPair(a, a), ArcPair(b, b)], test=[])
+        assert task.train_inputs_stacked is None
+        assert task.train_outputs_stacked is None
+
+
 class TestDSLSolver:
     def test_solves_rotation(self) -> None:
         task = _make_rotation_task()
@@ -96,6 +114,18 @@ class TestDSLSolver:
         result = solve_with_dsl(task)
         assert result.correct is True
 
+    def test_solves_two_step_composition(self) -> None:
+        inp = np.array([[1, 2], [3, 4]])
+        out = np.rot90(np.repeat(np.repeat(inp, 2, axis=0), 2, axis=1), k=-1)
+        task = ArcTask(
+            id="compose_test",
+            train=[ArcPair(input=inp, output=out)],
+            test=[ArcPair(input=inp, output=out)],
+        )
+        result = solve_with_dsl(task)
+        assert result.correct is True
+        assert result.method == "dsl_compose_2"
+
     def test_unsolvable_returns_false(self) -> None:
         task = _make_unsolvable_task()
         result = solve_with_dsl(task)
@@ -108,6 +138,62 @@ class TestDSLSolver:
         assert result.solve_time_ms > 0
 
 
+class _FakeLLM:
+    def __init__(self, content: str) -> None:
+        self.content = content
+
+    def invoke(self, messages: object) -> _FakeLLM:
+        return self
+
+
+class TestLLMSolver:
+    def test_generated_code_solves_task(self) -> None:
+        code = "```python\ndef solve(grid):\n    return np.rot90(grid, k=-1)\n```"
+        result = solve_with_llm(_make_rotation_task(), llm=_FakeLLM(code))
+        assert result.method == "llm"
+        assert result.correct is True
+
+    def test_runaway_code_is_terminated(self) -> None:
+        code = "def solve(grid):\n    while True:\n        pass\n"
+        with pytest.raises(TimeoutError):
+            _run_llm_solve(code, [np.zeros((2, 2), dtype=np.uint8)], timeout_s=0.5)
+
+    def test_child_is_not_forked(self) -> None:
+        import multiprocessing
+        from unittest.mock import patch
+
+        code = "def solve(grid):\n    return grid + 1\n"
+        with patch(
+            "isaac.arc.evaluator.multiprocessing.get_context",
+            wraps=multiprocessing.get_context,
+        ) as get_context:
+            out = _run_llm_solve(code, [np.zeros((2, 2), dtype=np.uint8)])
+        assert get_context.call_args.args[0] in ("forkserver", "spawn")
+        assert out[0].tolist() == [[1, 1], [1, 1]]
+
+    def test_worker_runs_parent_compiled_code(self) -> None:
+        import marshal
+        import multiprocessing
+        from unittest.mock import patch
+
+        from isaac.arc.evaluator import _compile_llm_code, _llm_solve_worker
+
+        code = "def solve(grid):\n    return grid * 2\n"
+        compiled = marshal.dumps(_compile_llm_code(code))
+        recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+        with patch("isaac.arc.evaluator._compile_llm_code") as recompile:
+            _llm_solve_worker(compiled, [np.ones((1, 2), dtype=np.uint8)], send_conn)
+        recompile.assert_not_called()
+        ok, out = recv_conn.recv()
+        assert ok
+        assert out[0].tolist() == [[2, 2]]
+
+    def test_code_errors_are_reported(self) -> None:
+        code = "def solve(grid):\n    raise ValueError('boom')\n"
+        with pytest.raises(RuntimeError, match="boom"):
+            _run_llm_solve(code, [np.zeros((2, 2), dtype=np.uint8)])
+
+
 class TestBuildArcPrompt:
     def test_prompt_contains_training_data(self) -> None:
         task = _make_rotation_task()
@@ -116,6 +202,10 @@ class TestBuildArcPrompt:
         assert "Test Input 1" in prompt
         assert "solve(grid" in prompt
 
+    def test_prompt_built_once_per_task(self) -> None:
+        task = _make_rotation_task()
+        assert build_arc_prompt(task) is build_arc_prompt(task)
+
     def test_prompt_includes_structural_analysis(self) -> None:
         task = _make_rotation_task()
         prompt = build_arc_prompt(task)
@@ -133,6 +223,37 @@ class TestEvaluate:
         assert len(report.results) == 3
         assert report.total_time_ms > 0
 
+    def test_evaluate_dsl_in_process_matches_pool(self) -> None:
+        tasks = [_make_rotation_task(), _make_unsolvable_task(), _make_flip_task()]
+        pooled = evaluate(tasks, solver="dsl", max_workers=2)
+        serial = evaluate(tasks, solver="dsl", max_workers=1)
+        assert [r.task_id for r in pooled.results] == [t.id for t in tasks]
+        assert [r.correct for r in pooled.results] == [r.correct for r in serial.results]
+
+    def test_evaluate_dsl_pool_under_spawn(self, caplog: pytest.LogCaptureFixture) -> None:
+        import multiprocessing
+        from unittest.mock import patch
+
+        tasks = [_make_rotation_task(), _make_flip_task()]
+        with patch(
+            "isaac.arc.evaluator._no_fork_context",
+            return_value=multiprocessing.get_context("spawn"),
+        ):
+            report = evaluate(tasks, solver="dsl", max_workers=2)
+        assert "pool unavailable" not in caplog.text
+        assert [r.correct for r in report.results] == [True, True]
+
+    def test_dsl_pool_is_not_forked(self) -> None:
+        from concurrent.futures import ProcessPoolExecutor
+        from unittest.mock import patch
+
+        tasks = [_make_rotation_task(), _make_flip_task()]
+        with patch(
+            "isaac.arc.evaluator.ProcessPoolExecutor", wraps=ProcessPoolExecutor,
+        ) as pool:
+            evaluate(tasks, solver="dsl", max_workers=2)
+        assert pool.call_args.kwargs["mp_context"].get_start_method() in ("forkserver", "spawn")
+
     def test_evaluate_empty(self) -> None:
         report = evaluate([], solver="dsl")
         assert report.total_tasks == 0
@@ -5,7 +5,6 @@ from __future__ import annotations
 import numpy as np
 
 from isaac.arc.grid_ops import (
-    GridObject,
     analyse_grid,
     detect_background,
     detect_repeating_pattern,
@@ -30,6 +29,16 @@ class TestExtractColours:
         assert colours[1] == 1
         assert colours[2] == 1
 
+    def test_values_outside_colour_range(self) -> None:
+        grid = np.array([[-1, 300], [300, 0]])
+        assert extract_colours(grid) == {-1: 1, 0: 1, 300: 2}
+        assert detect_background(grid) == 300
+
+    def test_negative_int8_values(self) -> None:
+        grid = np.array([[-1, 0], [-1, 2]], dtype=np.int8)
+        assert extract_colours(grid) == {-1: 2, 0: 1, 2: 1}
+        assert detect_background(grid) == -1
+
 
 class TestDetectBackground:
     def test_majority_is_background(self) -> None:
@@ -81,6 +90,25 @@ class TestExtractObjects:
         sub = objs[0].as_subgrid(grid)
         assert sub.shape == (2, 2)
 
+    def test_cells_stored_as_row_col_arrays(self) -> None:
+        grid = np.array([[0, 4, 4], [0, 4, 0]])
+        obj = extract_objects(grid, background=0)[0]
+        assert obj.rows.dtype == np.int16
+        assert sorted(obj.cells) == [(0, 1), (0, 2), (1, 1)]
+        assert np.all(grid[obj.rows, obj.cols] == 4)
+
+    def test_label_and_flood_fill_paths_agree(self, monkeypatch) -> None:
+        import isaac.arc.grid_ops as grid_ops
+
+        rng = np.random.default_rng(0)
+        grid = rng.integers(0, 4, size=(12, 12))
+        labelled = extract_objects(grid, background=0)
+        monkeypatch.setattr(grid_ops, "_LABEL_MIN_CELLS", grid.size + 1)
+        filled = extract_objects(grid, background=0)
+        assert [(o.id, o.colour, sorted(o.cells), o.bbox) for o in labelled] == [
+            (o.id, o.colour, sorted(o.cells), o.bbox) for o in filled
+        ]
+
 
 class TestDetectSymmetry:
     def test_horizontal_symmetry(self) -> None:
@@ -109,6 +137,11 @@ class TestDetectSymmetry:
         symmetry = detect_symmetry(grid)
         assert symmetry["diagonal"] is False
 
+    def test_inner_row_mismatch_breaks_symmetry(self) -> None:
+        grid = np.array([[1, 2], [3, 4], [5, 6], [1, 2]])
+        symmetry = detect_symmetry(grid)
+        assert symmetry["horizontal"] is False
+
 
 class TestDetectRepeatingPattern:
     def test_tiled_pattern(self) -> None:
@@ -124,6 +157,10 @@ class TestDetectRepeatingPattern:
         grid = np.ones((4, 4), dtype=int)
         assert detect_repeating_pattern(grid) is True
 
+    def test_rows_repeat_but_columns_do_not(self) -> None:
+        grid = np.tile(np.array([[1, 2, 3]]), (4, 1))
+        assert detect_repeating_pattern(grid) is False
+
 
 class TestGridHash:
     def test_same_grid_same_hash(self) -> None:
@@ -136,6 +173,23 @@ class TestGridHash:
         g2 = np.array([[4, 3], [2, 1]])
         assert grid_hash(g1) != grid_hash(g2)
 
+    def test_hash_is_stable_across_processes(self) -> None:
+        import subprocess
+        import sys
+
+        code = (
+            "import numpy as np; from isaac.arc.grid_ops import grid_hash; "
+            "print(grid_hash(np.array([[1, 2], [3, 4]], dtype=np.uint8)))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        assert out == grid_hash(np.array([[1, 2], [3, 4]], dtype=np.uint8))
+
+    def test_non_contiguous_grid_hashes_like_its_copy(self) -> None:
+        g = np.arange(12).reshape(3, 4)[:, ::2]
+        assert grid_hash(g) == grid_hash(g.copy())
+
 
 class TestAnalyseGrid:
     def test_full_analysis(self) -> None:
@@ -149,6 +203,12 @@ class TestAnalyseGrid:
         assert analysis.objects[0].colour == 1
         assert isinstance(analysis.grid_hash, str)
 
+    def test_repeated_grid_reuses_analysis(self) -> None:
+        grid = np.array([[0, 2], [2, 0]])
+        assert analyse_grid(grid) is analyse_grid(grid.copy())
+        assert analyse_grid(grid) is not analyse_grid(grid.astype(np.uint8))
+        assert analyse_grid(grid).grid_hash == grid_hash(grid)
+
 
 class TestGridDiff:
     def test_diff_detects_changes(self) -> None:
@@ -171,6 +231,14 @@ class TestGridDiff:
         assert 2 in diff["colour_changes"]["added"]
         assert 1 in diff["colour_changes"]["removed"]
 
+    def test_changed_cells_capped_but_counted(self) -> None:
+        inp = np.zeros((8, 8), dtype=int)
+        out = np.ones((8, 8), dtype=int)
+        diff = grid_diff(inp, out)
+        assert diff["n_changed_cells"] == 64
+        assert len(diff["changed_cells"]) == 50
+        assert diff["changed_cells"][0] == {"row": 0, "col": 0, "from": 0, "to": 1}
+
 
 class TestFormatGrid:
     def test_format_output(self) -> None:
@@ -181,3 +249,7 @@ class TestFormatGrid:
     def test_single_cell(self) -> None:
         grid = np.array([[7]])
         assert format_grid_for_prompt(grid) == "7"
+
+    def test_multi_digit_values(self) -> None:
+        grid = np.array([[10, 0], [2, 99]])
+        assert format_grid_for_prompt(grid) == "10 0\n2 99"
@@ -0,0 +1,37 @@
+"""Tests for the lazily-built settings module."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+class TestLazySettings:
+    def test_import_does_not_load_pydantic(self) -> None:
+        code = (
+            "import sys, isaac.config.settings\n"
+            "print('pydantic_settings' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_singleton_shared_between_accessors(self) -> None:
+        from isaac.config.settings import Settings, get_settings, settings
+
+        assert isinstance(settings, Settings)
+        assert get_settings() is settings
+
+    def test_unknown_attribute_raises(self) -> None:
+        import pytest
+
+        import isaac.config.settings as mod
+
+        with pytest.raises(AttributeError):
+            mod.not_a_setting  # noqa: B018
+
+    def test_public_surface(self) -> None:
+        import isaac.config.settings as mod
+
+        assert sorted(mod.__all__) == ["Settings", "get_settings", "settings"]
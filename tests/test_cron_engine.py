@@ -3,9 +3,7 @@
 from __future__ import annotations
 
 import json
-import time
 from pathlib import Path
-from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -64,6 +62,20 @@ class TestCronTaskCRUD:
         tasks = load_tasks()
         assert tasks[0].enabled
 
+    def test_resume_enabled_task_does_not_rewrite(self) -> None:
+        from isaac.background.cron_engine import add_task, resume_task
+
+        task = add_task(name="Running", schedule="0 * * * *", command="echo hi")
+        with patch("isaac.background.cron_engine.save_tasks") as save:
+            assert resume_task(task.id)
+        save.assert_not_called()
+
+    def test_save_leaves_no_temp_file(self) -> None:
+        from isaac.background.cron_engine import add_task
+
+        add_task(name="A", schedule="0 * * * *", command="echo a")
+        assert sorted(p.name for p in self._home.iterdir()) == ["cron_tasks.json"]
+
     def test_list_tasks_empty(self) -> None:
         from isaac.background.cron_engine import list_tasks
 
@@ -97,7 +109,11 @@ class TestCronDaemon:
         self._patcher.stop()
 
     def test_start_and_stop(self) -> None:
-        from isaac.background.cron_engine import is_cron_running, start_cron_daemon, stop_cron_daemon
+        from isaac.background.cron_engine import (
+            is_cron_running,
+            start_cron_daemon,
+            stop_cron_daemon,
+        )
 
         start_cron_daemon(poll_seconds=1)
         assert is_cron_running()
@@ -130,6 +146,7 @@ class TestCronIsDue:
 
     def test_recently_run_not_due(self) -> None:
         from datetime import datetime, timezone
+
         from isaac.background.cron_engine import CronTask, _is_due
 
         # Just ran, every hour schedule
@@ -140,3 +157,248 @@ class TestCronIsDue:
             assert not result
         except ImportError:
             pytest.skip("croniter not installed")
+
+    def test_stored_next_run_skips_croniter(self) -> None:
+        from datetime import datetime, timedelta, timezone
+
+        from isaac.background.cron_engine import CronTask, _is_due
+
+        now = datetime.now(timezone.utc)
+        task = CronTask(
+            schedule="0 * * * *",
+            last_run=(now - timedelta(hours=2)).isoformat(),
+            next_run=(now - timedelta(hours=1)).isoformat(),
+        )
+        with patch("isaac.background.cron_engine._next_run") as next_run:
+            assert _is_due(task)
+        next_run.assert_not_called()
+
+    def test_epoch_next_run_checked_without_datetimes(self) -> None:
+        import time as _time
+
+        from isaac.background.cron_engine import CronTask, _is_due
+
+        task = CronTask(schedule="0 * * * *", last_run="2000-01-01T00:00:00+00:00")
+        task.next_run_ts = _time.time() + 3600
+        with patch("isaac.background.cron_engine.datetime") as dt:
+            assert not _is_due(task)
+        dt.fromisoformat.assert_not_called()
+
+    def test_missing_next_run_is_filled_in(self) -> None:
+        from datetime import datetime, timezone
+
+        from isaac.background.cron_engine import CronTask, _is_due
+
+        task = CronTask(schedule="0 * * * *", last_run=datetime.now(timezone.utc).isoformat())
+        assert not _is_due(task)
+        assert datetime.fromisoformat(task.next_run) > datetime.fromisoformat(task.last_run)
+        assert task.next_run_ts == datetime.fromisoformat(task.next_run).timestamp()
+
+    def test_invalid_schedule_is_not_due(self) -> None:
+        pytest.importorskip("croniter")
+        from isaac.background.cron_engine import CronTask, _is_due
+
+        assert not _is_due(CronTask(schedule="not a cron", last_run=""))
+        assert not _is_due(CronTask(schedule="61 * * * *", last_run="2000-01-01T00:00:00+00:00"))
+
+
+class TestCronTick:
+    """Tests for a single daemon tick."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path: Path) -> None:
+        self._home = tmp_path / ".isaac"
+        self._home.mkdir()
+        self._patcher = patch(
+            "isaac.background.cron_engine._isaac_home",
+            return_value=self._home,
+        )
+        self._patcher.start()
+
+    def teardown_method(self) -> None:
+        self._patcher.stop()
+
+    def test_fired_tasks_saved_once(self) -> None:
+        from isaac.background import cron_engine
+        from isaac.background.cron_engine import add_task, load_tasks
+
+        add_task(name="A", schedule="* * * * *", command="echo a")
+        add_task(name="B", schedule="* * * * *", command="echo b")
+        add_task(name="Off", schedule="* * * * *", command="echo off", enabled=False)
+
+        cron_engine._stop_event.clear()
+        with patch.object(cron_engine, "_execute_task", return_value="ok"), \
+                patch.object(cron_engine, "save_tasks", wraps=cron_engine.save_tasks) as save:
+            cron_engine._run_due_tasks()
+
+        assert save.call_count == 1
+        statuses = {t.name: t.last_status for t in load_tasks()}
+        assert statuses == {"A": "ok", "B": "ok", "Off": ""}
+        assert all(t.next_run > t.last_run for t in load_tasks() if t.enabled)
+        assert all(t.next_run_ts > 0 for t in load_tasks() if t.enabled)
+
+    def test_failing_task_does_not_discard_others(self) -> None:
+        from isaac.background import cron_engine
+        from isaac.background.cron_engine import add_task, load_tasks
+
+        add_task(name="A", schedule="* * * * *", command="echo a")
+        add_task(name="B", schedule="* * * * *", command="echo b")
+
+        cron_engine._stop_event.clear()
+        with patch.object(cron_engine, "_execute_task", side_effect=["ok", RuntimeError("boom")]):
+            cron_engine._run_due_tasks()
+
+        statuses = {t.name: t.last_status for t in load_tasks()}
+        assert statuses == {"A": "ok", "B": ""}
+
+    def test_fired_task_saved_when_tick_is_interrupted(self) -> None:
+        from isaac.background import cron_engine
+        from isaac.background.cron_engine import add_task, load_tasks
+
+        add_task(name="A", schedule="* * * * *", command="echo a")
+        add_task(name="B", schedule="* * * * *", command="echo b")
+
+        cron_engine._stop_event.clear()
+        with patch.object(
+            cron_engine, "_execute_task", side_effect=["ok", KeyboardInterrupt]
+        ), pytest.raises(KeyboardInterrupt):
+            cron_engine._run_due_tasks()
+
+        assert {t.name: t.last_status for t in load_tasks()} == {"A": "ok", "B": ""}
+
+
+class TestManifestCache:
+    """Tests for the parsed-manifest cache."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path: Path) -> None:
+        self._home = tmp_path / ".isaac"
+        self._home.mkdir()
+        self._patcher = patch(
+            "isaac.background.cron_engine._isaac_home",
+            return_value=self._home,
+        )
+        self._patcher.start()
+
+    def teardown_method(self) -> None:
+        self._patcher.stop()
+
+    def test_unchanged_file_is_not_reparsed(self) -> None:
+        from isaac.background.cron_engine import add_task, load_tasks
+
+        add_task(name="A", schedule="0 * * * *", command="echo a")
+        with patch("isaac.background.cron_engine.json.loads") as loads:
+            tasks = load_tasks()
+        loads.assert_not_called()
+        assert [t.name for t in tasks] == ["A"]
+
+    def test_returned_tasks_are_copies(self) -> None:
+        from isaac.background.cron_engine import add_task, load_tasks
+
+        add_task(name="A", schedule="0 * * * *", command="echo a")
+        load_tasks()[0].enabled = False
+        assert load_tasks()[0].enabled
+
+    def test_external_edit_is_picked_up(self) -> None:
+        from isaac.background.cron_engine import add_task, load_tasks
+
+        task = add_task(name="A", schedule="0 * * * *", command="echo a")
+        manifest = self._home / "cron_tasks.json"
+        data = json.loads(manifest.read_text(encoding="utf-8"))
+        data[0]["name"] = "Edited externally"
+        manifest.write_text(json.dumps(data), encoding="utf-8")
+        assert load_tasks()[0].name == "Edited externally"
+        assert load_tasks()[0].id == task.id
+
+    def test_replaced_file_with_same_mtime_and_size_is_picked_up(self) -> None:
+        import os
+
+        from isaac.background.cron_engine import add_task, load_tasks
+
+        add_task(name="A", schedule="0 * * * *", command="echo a")
+        manifest = self._home / "cron_tasks.json"
+        st = manifest.stat()
+        replacement = self._home / "other.json"
+        replacement.write_text(manifest.read_text(encoding="utf-8").replace('"A"', '"B"'))
+        os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(replacement, manifest)
+        assert load_tasks()[0].name == "B"
+
+    def test_failed_save_leaves_no_temp_file(self) -> None:
+        from isaac.background.cron_engine import CronTask, add_task, load_tasks, save_tasks
+
+        add_task(name="A", schedule="0 * * * *", command="echo a")
+        with patch("isaac.background.cron_engine.os.replace", side_effect=OSError("full")), \
+                pytest.raises(OSError):
+            save_tasks([CronTask(name="B")])
+        assert [p.name for p in self._home.iterdir()] == ["cron_tasks.json"]
+        assert [t.name for t in load_tasks()] == ["A"]
+
+
+class TestExecutionLog:
+    """Tests for the execution log writer."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path: Path) -> None:
+        self._home = tmp_path / ".isaac"
+        self._patcher = patch(
+            "isaac.background.cron_engine._isaac_home",
+            return_value=self._home,
+        )
+        self._patcher.start()
+
+    def teardown_method(self) -> None:
+        from isaac.background import cron_engine
+        with cron_engine._log_lock:
+            cron_engine._close_log()
+        self._patcher.stop()
+
+    def test_lines_appended_through_one_descriptor(self) -> None:
+        from isaac.background import cron_engine
+
+        cron_engine._append_log("t1", "ok")
+        with patch("isaac.background.cron_engine.os.open") as os_open:
+            cron_engine._append_log("t2", "error", "boom")
+        os_open.assert_not_called()
+
+        lines = (self._home / "cron_execution.log").read_text(encoding="utf-8").splitlines()
+        assert lines[0].endswith("task=t1  status=ok")
+        assert lines[1].endswith("task=t2  status=error  detail=boom")
+
+    def test_reopens_after_rotation(self) -> None:
+        from isaac.background import cron_engine
+
+        cron_engine._append_log("t1", "ok")
+        log = self._home / "cron_execution.log"
+        log.rename(self._home / "cron_execution.log.1")
+        cron_engine._append_log("t2", "ok")
+        assert "task=t2" in log.read_text(encoding="utf-8")
+        assert "task=t2" not in (self._home / "cron_execution.log.1").read_text(encoding="utf-8")
+
+    def test_reopens_after_descriptor_closed(self) -> None:
+        import os
+
+        from isaac.background import cron_engine
+
+        cron_engine._append_log("t1", "ok")
+        os.close(cron_engine._log_fd[1])
+        cron_engine._append_log("t2", "ok")
+        log = (self._home / "cron_execution.log").read_text(encoding="utf-8")
+        assert "task=t2" in log
+
+
+class TestParseCommand:
+    """Tests for connector-style command parsing."""
+
+    def test_connector_command(self) -> None:
+        from isaac.background.cron_engine import _parse_command
+
+        assert _parse_command("web_search: latest news lang=en") == (
+            "web_search", (("query", "latest"), ("lang", "en")),
+        )
+
+    def test_plain_and_url_commands_are_not_connectors(self) -> None:
+        from isaac.background.cron_engine import _parse_command
+
+        assert _parse_command("echo hello") is None
+        assert _parse_command("http://example.com/hook") is None
@@ -68,6 +68,23 @@ class TestAfterReflection:
 
         assert result == "__end__"
 
+    def test_reflection_and_ui_errors_share_retry_budget(self) -> None:
+        state = make_initial_state()
+        state["skill_candidate"] = None
+        state["errors"] = [
+            ErrorEntry(node="reflection", message="fail", attempt=1),
+            ErrorEntry(node="computer_use", message="fail", attempt=1),
+            ErrorEntry(node="sandbox", message="ignored", attempt=1),
+        ]
+        state["iteration"] = 2
+
+        with patch("isaac.config.settings.settings") as cfg:
+            cfg.graph.max_retries = 2
+            cfg.graph.max_iterations = 10
+            result = after_reflection(state)
+
+        assert result == "__end__"
+
     def test_iteration_cap_terminates(self) -> None:
         state = make_initial_state()
         state["skill_candidate"] = SkillCandidate(name="x", code="pass", success_count=1)
@@ -108,3 +125,28 @@ class TestAfterSkillAbstraction:
             result = after_skill_abstraction(state)
 
         assert result == "__end__"
+
+
+class TestBuildGraph:
+    def test_compiled_graph_is_reused(self) -> None:
+        from isaac.core.graph import build_graph
+
+        assert build_graph() is build_graph()
+
+    def test_background_build_returns_shared_graph(self) -> None:
+        from isaac.core.graph import build_graph, build_graph_in_background
+
+        assert build_graph_in_background().result(timeout=60) is build_graph()
+
+    def test_import_does_not_load_nodes(self) -> None:
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, isaac.core.graph\n"
+            "print(any(m.startswith(('isaac.nodes', 'langgraph')) for m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        )
+        assert out.stdout.strip() == "False"
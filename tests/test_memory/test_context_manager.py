@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 
 from isaac.memory.context_manager import (
     _estimate_tokens,
@@ -115,3 +115,17 @@ class TestCompressMessages:
         # keep_recent >= non-system count → no compression
         result = compress_messages(msgs, max_messages=1, keep_recent=5)
         assert result == msgs
+
+    def test_tool_results_stay_with_their_call(self) -> None:
+        call = AIMessage(
+            content="", tool_calls=[{"name": "t", "args": {}, "id": "c1"}],
+        )
+        msgs = [HumanMessage(content=f"msg {i}") for i in range(10)] + [
+            call,
+            ToolMessage(content="r1", tool_call_id="c1"),
+            ToolMessage(content="r2", tool_call_id="c1"),
+            HumanMessage(content="last"),
+        ]
+        result = compress_messages(msgs, max_messages=10, keep_recent=3)
+        assert result[1] is call
+        assert len(result) == 5
@@ -147,6 +147,31 @@ class TestComputerUseNode:
         # Cycle counter should equal max_cycles
         assert result["ui_cycle"] == 2
 
+    def test_after_screenshot_reused_for_next_cycle(self) -> None:
+        state = make_initial_state()
+        state["plan"] = [
+            PlanStep(id="s1", description="open browser", status="active", mode="ui")
+        ]
+
+        mock_llm = MockLLM(
+            '{"done": false, "action": {"type": "click", "x": 10, "y": 10, "description": "try"}}'
+        )
+        mock_exec = _make_mock_executor()
+
+        import isaac.nodes.computer_use as cu_mod
+
+        with (
+            patch.object(cu_mod, "_get_ui_executor", return_value=mock_exec),
+            patch("isaac.llm.provider.get_llm", return_value=mock_llm),
+            patch("isaac.config.settings.settings") as ms,
+        ):
+            ms.graph.max_ui_cycles = 3
+            result = computer_use_node(state)
+
+        assert mock_exec.act.call_count == 3
+        assert mock_exec.get_gui_state.call_count == 1
+        assert result["world_model"].gui_state.screenshot_b64 == _DUMMY_B64
+
     def test_no_active_step_returns_early(self) -> None:
         state = make_initial_state()
         state["plan"] = [PlanStep(id="s1", description="done step", status="done")]
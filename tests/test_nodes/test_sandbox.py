@@ -35,3 +35,19 @@ class TestSandboxNode:
         assert logs[0].exit_code == 0
         assert logs[0].stdout == "hello\n"
         mock_executor.close.assert_called_once()
+
+    def test_repeated_stderr_shares_previous_string(self) -> None:
+        previous = ExecutionResult(stdout="", stderr="Traceback: boom\n", exit_code=1)
+        state = make_initial_state()
+        state["code_buffer"] = "raise SystemExit(1)"
+        state["execution_logs"] = [previous]
+
+        mock_executor = MagicMock()
+        mock_executor.execute.return_value = ExecutionResult(
+            stdout="", stderr="".join(["Traceback: ", "boom\n"]), exit_code=1,
+        )
+
+        with patch("isaac.nodes.sandbox.CodeExecutor", return_value=mock_executor):
+            result = sandbox_node(state)
+
+        assert result["execution_logs"][0].stderr is previous.stderr
@@ -109,3 +109,76 @@ class TestAuditLog:
         log2 = AuditLog(log_dir=audit_dir)
         e2 = log2.log("system", "resumed")
         assert e2.prev_hash == e1.entry_hash
+
+    def test_verify_chain_tail(self, audit_log: AuditLog) -> None:
+        for i in range(10):
+            audit_log.log("system", f"event_{i}", details={"i": i})
+        assert audit_log.verify_chain_tail(4) == (True, 4)
+        assert audit_log.verify_chain_tail(50) == (True, 10)
+
+    def test_verify_chain_tail_detects_tampering(
+        self, audit_log: AuditLog, audit_dir: Path,
+    ) -> None:
+        for i in range(5):
+            audit_log.log("system", f"event_{i}")
+        log_path = audit_dir / "audit.jsonl"
+        lines = log_path.read_text(encoding="utf-8").strip().split("\n")
+        entry = json.loads(lines[-2])
+        entry["action"] = "TAMPERED"
+        lines[-2] = json.dumps(entry)
+        log_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        assert audit_log.verify_chain_tail(3) == (False, 1)
+
+    def test_verify_chain_parallel_matches_serial(
+        self, audit_log: AuditLog, audit_dir: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import isaac.security.audit as audit_mod
+
+        monkeypatch.setattr(audit_mod, "_PARALLEL_MIN_BYTES", 0)
+        for i in range(40):
+            audit_log.log("system", f"event_{i}", details={"i": i})
+        assert audit_log.verify_chain_parallel(workers=3) == (True, 40)
+
+        log_path = audit_dir / "audit.jsonl"
+        lines = log_path.read_text(encoding="utf-8").strip().split("\n")
+        del lines[25]
+        log_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        assert audit_log.verify_chain_parallel(workers=3) == audit_log.verify_chain()
+        assert audit_log.verify_chain() == (False, 25)
+
+    def test_verify_chain_parallel_corrupt_line(
+        self, audit_log: AuditLog, audit_dir: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import isaac.security.audit as audit_mod
+
+        monkeypatch.setattr(audit_mod, "_PARALLEL_MIN_BYTES", 0)
+        for i in range(40):
+            audit_log.log("system", f"event_{i}", details={"i": i})
+        log_path = audit_dir / "audit.jsonl"
+        original = log_path.read_bytes()
+        size = len(original)
+        # A line in the middle of a range, and the first line of each range
+        starts = [start for start, _ in audit_log._split_ranges(size, 3)]
+        targets = {20} | {original[:start].count(b"\n") for start in starts}
+
+        for idx in sorted(targets):
+            lines = original.decode("utf-8").strip().split("\n")
+            lines[idx] = "{not json"
+            log_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            assert audit_log.verify_chain() == (False, idx)
+            assert audit_log.verify_chain_parallel(workers=3) == (False, idx)
+
+    def test_verify_without_orjson(
+        self, audit_log: AuditLog, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import isaac.security.audit as audit_mod
+
+        for i in range(3):
+            audit_log.log("system", f"event_{i}", details={"i": i})
+        monkeypatch.setattr(audit_mod, "load_orjson", lambda: None)
+        assert audit_log.verify_chain() == (True, 3)
+
+    def test_verify_nan_details(self, audit_log: AuditLog) -> None:
+        audit_log.log("system", "metric", details={"score": float("nan")})
+        assert audit_log.verify_chain() == (True, 1)
@@ -83,3 +83,28 @@ class TestMakeInitialState:
         assert state["plan"] == []
         assert state["errors"] == []
         assert state["skill_candidate"] is None
+
+
+class TestAppendList:
+    def test_empty_update_returns_left(self) -> None:
+        from isaac.core.state import _append_list
+
+        left = [1, 2]
+        assert _append_list(left, []) is left
+
+    def test_does_not_mutate_left(self) -> None:
+        from isaac.core.state import _append_list
+
+        left = [1, 2]
+        assert _append_list(left, [3]) == [1, 2, 3]
+        assert left == [1, 2]
+
+
+class TestSlots:
+    def test_undeclared_attribute_rejected(self) -> None:
+        import pytest
+
+        from isaac.core.state import ScreenElement
+
+        with pytest.raises(AttributeError):
+            ScreenElement(label="OK", role="button").not_a_field = 1  # type: ignore[attr-defined]
@@ -97,3 +97,13 @@ class TestToolRegistry:
         safe = reg.filter_by_max_risk(2)
         assert len(safe) == 1
         assert safe[0].name == "dummy"
+
+
+class TestRegisterAllTools:
+    def test_registers_once(self) -> None:
+        from isaac.tools import register_all_tools
+
+        registry = register_all_tools()
+        tools = registry.list_all()
+        assert register_all_tools() is registry
+        assert all(a is b for a, b in zip(registry.list_all(), tools))
@@ -0,0 +1,69 @@
+"""Tests for the warm background daemon."""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets not available",
+)
+
+
+class TestHandleRequest:
+    def test_unknown_command(self) -> None:
+        from isaac.background.warm_daemon import handle_request
+
+        reply = handle_request({"cmd": "nope"})
+        assert reply["ok"] is False
+
+    def test_handler_error_is_reported(self) -> None:
+        from isaac.background import warm_daemon
+
+        with patch.dict(warm_daemon._HANDLERS, {"boom": lambda req: 1 / 0}):
+            reply = warm_daemon.handle_request({"cmd": "boom"})
+        assert reply == {"ok": False, "error": "division by zero"}
+
+
+class TestClientServer:
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("ISAAC_HOME", str(tmp_path))
+        self._home = tmp_path
+
+    def test_socket_follows_settings_home(self) -> None:
+        from isaac.background.warm_daemon import _socket_path
+        from isaac.config._models import Settings
+
+        assert _socket_path().parent == Settings().isaac_home == self._home
+
+    def test_request_without_daemon_returns_none(self) -> None:
+        from isaac.background.warm_daemon import is_daemon_running, request
+
+        assert request("ping") is None
+        assert not is_daemon_running()
+
+    def test_round_trip_and_shutdown(self) -> None:
+        from isaac.background import warm_daemon
+
+        with patch.object(warm_daemon, "_warm_up"):
+            server = threading.Thread(target=warm_daemon.serve, daemon=True)
+            server.start()
+            for _ in range(50):
+                if (self._home / "isaacd.sock").exists():
+                    break
+                time.sleep(0.02)
+
+            assert warm_daemon.request("ping") == "pong"
+            assert (self._home / "isaacd.sock").stat().st_mode & 0o077 == 0
+            assert warm_daemon.request("nope") is None
+            assert warm_daemon.stop_daemon()
+            server.join(timeout=5)
+
+        assert not server.is_alive()
+        assert not (self._home / "isaacd.sock").exists()